@@ -1,27 +1,30 @@
-from datetime import datetime
 import json
 import logging
 import os
+import shutil
+from itertools import islice
+from operator import itemgetter
+from stat import S_ISDIR
 from fastapi import (
     APIRouter,
     Depends,
     File,
     Form,
     HTTPException,
-    Request,
     UploadFile,
     WebSocket,
     WebSocketDisconnect,
 )
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from pydantic import BaseModel
 import asyncio
+import orjson
 import time
 
-from watchfiles import awatch
-from ..auth import get_current_user
+from watchfiles import Change, DefaultFilter, awatch
+from ..auth import User, get_current_user
 from modules.servers import Server, ServerType, get_servers
-from modules.jar import MinecraftServerDownloader
+from modules.jar import AsyncMinecraftServerDownloader
 from .utils import get_server_instance, process_server
 
 logger = logging.getLogger(__name__)
@@ -40,33 +43,32 @@ class ServerResponse(BaseModel):
     ip: Optional[Dict[str, str]] = None
 
 
+def _classify_line(lowered: str) -> str:
+    """Return the console category of a lowercased line, checked in priority order"""
+    if "fail" in lowered or "exception" in lowered or "traceback" in lowered:
+        return "critical"
+    if "error" in lowered or "severe" in lowered:
+        return "error"
+    if "warn" in lowered:
+        return "warning"
+    if "done " in lowered and "for help" in lowered:
+        return "success"
+    if "eula" in lowered:
+        return "eula"
+    if "starting" in lowered or "started" in lowered:
+        return "startup"
+    if "stopping" in lowered or "stopped" in lowered:
+        return "shutdown"
+    if "info" in lowered:
+        return "info"
+    if "debug" in lowered:
+        return "debug"
+    return "default"
+
+
 def format_console_message(message: str, message_type: str | None = None):
-    # Use match-case for clearer message type detection (Python 3.10+)
-    lowered = message.lower()
     if message_type is None:
-        match True:
-            case _ if "error" in lowered or "severe" in lowered:
-                message_type = "error"
-            case _ if "warn" in lowered or "warning" in lowered:
-                message_type = "warning"
-            case _ if "done " in lowered and "for help" in lowered:
-                message_type = "success"
-            case _ if "info" in lowered:
-                message_type = "info"
-            case _ if "debug" in lowered:
-                message_type = "debug"
-            case _ if "eula" in lowered:
-                message_type = "eula"
-            case _ if (
-                "fail" in lowered or "exception" in lowered or "traceback" in lowered
-            ):
-                message_type = "critical"
-            case _ if "starting" in lowered or "started" in lowered:
-                message_type = "startup"
-            case _ if "stopping" in lowered or "stopped" in lowered:
-                message_type = "shutdown"
-            case _:
-                message_type = "default"
+        message_type = _classify_line(message.lower())
 
     return {
         "text": message,
@@ -76,10 +78,8 @@ def format_console_message(message: str, message_type: str | None = None):
 
 
 @router.get("/get", response_model=List[ServerResponse])
-async def list_servers(request: Request):
+async def list_servers(current_user: User = Depends(get_current_user)):
     """Get all servers with their current status"""
-    current_user = await get_current_user(request)
-
     try:
         server_names = get_servers()
         if not server_names:
@@ -94,30 +94,66 @@ async def list_servers(request: Request):
         )
 
 
+_VERSIONS_TTL = 600
+_versions_cache: Dict[str, Any] = {"data": None, "expires": 0.0}
+_versions_refresh: Optional[asyncio.Task] = None
+
+
+async def _fetch_versions() -> Dict[str, List[str]]:
+    """Fetch all version lists concurrently and store them in the module cache"""
+    downloader = AsyncMinecraftServerDownloader()
+    vanilla, paper, fabric, purpur = await asyncio.gather(
+        downloader.get_vanilla_versions(),
+        downloader.get_paper_versions(),
+        downloader.get_fabric_versions(),
+        downloader.get_purpur_versions(),
+    )
+    data = {
+        "vanilla": vanilla,
+        "paper": paper,
+        "fabric": fabric,
+        "purpur": purpur[::-1],
+    }
+    _versions_cache["data"] = data
+    _versions_cache["expires"] = time.time() + _VERSIONS_TTL
+    return data
+
+
+async def _refresh_versions():
+    try:
+        await _fetch_versions()
+    except Exception as e:
+        logger.warning(f"Background version refresh failed: {e}")
+
+
 @router.get("/versions")
-async def get_available_versions(request: Request):
+async def get_available_versions(current_user: User = Depends(get_current_user)):
     """Get available Minecraft versions for different server types"""
-    current_user = await get_current_user(request)
+    global _versions_refresh
 
     try:
-        downloader = MinecraftServerDownloader()
-        purpur = downloader.get_purpur_versions()
-        purpur.reverse()
-        return {
-            "vanilla": downloader.get_vanilla_versions(),
-            "paper": downloader.get_paper_versions(),
-            "fabric": downloader.get_fabric_versions(),
-            "purpur": purpur,
-        }
+        data = _versions_cache["data"]
+        if data is not None:
+            # Serve the cached lists; refresh stale ones in the background
+            if time.time() >= _versions_cache["expires"] and (
+                _versions_refresh is None or _versions_refresh.done()
+            ):
+                _versions_refresh = asyncio.create_task(_refresh_versions())
+            return data
+        return await _fetch_versions()
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch versions: {str(e)}"
         )
 
 
+def _save_upload(upload: UploadFile, path: str):
+    with open(path, "wb") as f:
+        shutil.copyfileobj(upload.file, f, 1 << 20)
+
+
 @router.post("/create", status_code=201)
 async def create_server(
-    request: Request,
     name: str = Form(...),
     type: str = Form(...),
     version: str = Form(...),
@@ -126,9 +162,9 @@ async def create_server(
     port: int = Form(...),
     maxPlayers: int = Form(...),
     jar_file: Optional[UploadFile] = File(None),  # optional file
+    current_user: User = Depends(get_current_user),
 ):
     """Create a new Minecraft server"""
-    current_user = await get_current_user(request)
 
     try:
         try:
@@ -138,11 +174,11 @@ async def create_server(
                 status_code=400,
                 detail=f"Invalid server type. Must be one of: {', '.join([t.value for t in ServerType])}",
             )
+        jar = None
         if jar_file:
-            # Save uploaded jar to 'versions/' folder
+            # Copy the spooled upload to 'versions/' 1MB at a time in one worker thread
             file_location = f"versions/{jar_file.filename}"
-            with open(file_location, "wb") as f:
-                f.write(await jar_file.read())
+            await asyncio.to_thread(_save_upload, jar_file, file_location)
             jar = file_location
 
         server = await Server.init(
@@ -162,16 +198,67 @@ async def create_server(
 
 
 HEARTBEAT_INTERVAL = 15
+WRITE_BATCH_SIZE = 64
+# Outgoing messages buffered per session; the oldest are dropped past this
+WRITE_QUEUE_SIZE = 1024
+# Files managed by the panel itself, hidden from the file browser
+_LOCKED_FILES = frozenset({"server.json", "server.log", "server.jar", "eula.txt"})
+
+
+class ServerFileFilter(DefaultFilter):
+    """Skip the files a running server rewrites constantly (region saves, temp files, locks)
+
+    Directories stay watched so the file index sees new logs, crash reports and
+    deleted worlds.
+    """
+
+    ignore_entity_patterns = (
+        *DefaultFilter.ignore_entity_patterns,
+        r"\.mca$",
+        r"\.tmp$",
+        r"^session\.lock$",
+    )
+
+
+async def send_json(websocket: WebSocket, payload: Any):
+    """Send a JSON text frame encoded with orjson (serializes datetimes natively)"""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+class SessionClosed(Exception):
+    """Raised by a websocket task to end the session and cancel its siblings"""
 
 
 @router.websocket("/ws/{server_name}")
 async def websocket_server(websocket: WebSocket, server_name: str):
     """WebSocket endpoint for real-time console + file updates"""
-    current_user = await get_current_user(websocket)  # type: ignore
+    # Authenticate once at the handshake; message handlers read
+    # websocket.state.user instead of re-validating the token per action
+    websocket.state.user = await get_current_user(websocket)  # type: ignore
     await websocket.accept()
     server = await get_server_instance(server_name)
     server.append_websocket(websocket)
 
+    # All outgoing messages go through one writer task, which coalesces
+    # whatever has queued up into a single array frame
+    outq: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+    closed = False
+
+    def send(payload: Any):
+        if closed:
+            return
+        if outq.full():
+            # A slow client loses the oldest lines rather than growing the queue
+            outq.get_nowait()
+        outq.put_nowait(payload)
+
+    async def writer():
+        while True:
+            batch = [await outq.get()]
+            while not outq.empty() and len(batch) < WRITE_BATCH_SIZE:
+                batch.append(outq.get_nowait())
+            await send_json(websocket, batch[0] if len(batch) == 1 else batch)
+
     def accepted_eula():
         eula_path = server.path / "eula.txt"
         return eula_path.exists()
@@ -179,20 +266,19 @@ async def websocket_server(websocket: WebSocket, server_name: str):
     async def send_to_websocket(message: str):
         try:
             formatted_message = format_console_message(message)
-            await websocket.send_json({"type": "console", "data": formatted_message})
+            send({"type": "console", "data": formatted_message})
         except Exception as e:
             print(f"Error sending message to WebSocket: {e}")
 
     server.set_output_callback(send_to_websocket)
 
-    # Send recent logs
+    # Send recent logs as a single batch frame
     if hasattr(server, "logs") and server.logs:
-        for line in server.logs[-100:]:
-            formatted_line = format_console_message(line)
-            await websocket.send_json({"type": "console", "data": formatted_line})
-            await asyncio.sleep(0.01)
+        start = max(0, len(server.logs) - 100)
+        batch = [format_console_message(line) for line in islice(server.logs, start, None)]
+        send({"type": "console_batch", "data": batch})
     else:
-        await websocket.send_json(
+        send(
             {
                 "type": "console",
                 "data": format_console_message(
@@ -202,7 +288,9 @@ async def websocket_server(websocket: WebSocket, server_name: str):
         )
 
     async def get_info():
-        metrics = await server.get_metrics(True)
+        metrics, players = await asyncio.gather(
+            server.get_metrics(True), server.players
+        )
         return {
             "name": server.name,
             "status": server.status,
@@ -211,168 +299,206 @@ async def websocket_server(websocket: WebSocket, server_name: str):
             "metrics": metrics if isinstance(metrics, dict) else metrics.__dict__,
             "port": server.port,
             "maxPlayers": server.players_limit,
-            "players": await server.players,
+            "players": players,
             "ip": server.ip,
         }
 
+    last_pong = time.monotonic()
+
     async def send_heartbeat():
         while True:
-            try:
-                await websocket.send_json({"type": "ping"})
-            except Exception:
-                break
+            send({"type": "ping"})
             await asyncio.sleep(HEARTBEAT_INTERVAL)
+            if time.monotonic() - last_pong > 2 * HEARTBEAT_INTERVAL:
+                logger.info("Heartbeat timed out, closing connection")
+                try:
+                    await websocket.close(1001)
+                except Exception:
+                    pass
+                raise SessionClosed()
 
     async def get_server_info():
         try:
-            await websocket.send_json({"type": "info", "data": await get_info()})
+            send({"type": "info", "data": await get_info()})
         except Exception as e:
-            await websocket.send_json({"type": "error", "data": str(e)})
+            send({"type": "error", "data": str(e)})
 
     async def start_server():
         try:
             if server.status == "online":
-                await websocket.send_json(
+                send(
                     {"type": "error", "data": "Server is already running"}
                 )
             await server.start()
         except Exception as e:
-            await websocket.send_json({"type": "error", "data": str(e)})
+            send({"type": "error", "data": str(e)})
 
     async def stop_server():
         try:
             if server.status == "offline":
-                await websocket.send_json(
+                send(
                     {"type": "error", "data": "Server is not running"}
                 )
             await server.stop()
         except Exception as e:
-            await websocket.send_json({"type": "error", "data": str(e)})
+            send({"type": "error", "data": str(e)})
 
     async def restart_server():
         try:
             await server.restart()
         except Exception as e:
-            await websocket.send_json({"type": "error", "data": str(e)})
+            send({"type": "error", "data": str(e)})
 
     async def send_command(command: str):
         try:
             if server.status != "online":
-                await websocket.send_json(
+                send(
                     {"type": "error", "data": "Server is not running"}
                 )
             await server.send_command(command)
         except Exception as e:
-            await websocket.send_json({"type": "error", "data": str(e)})
+            send({"type": "error", "data": str(e)})
 
     async def watch_files():
         base_path =  server.path
         if not base_path.exists():
-            await websocket.send_json({"type": "error", "data": "Path not found"})
+            send({"type": "error", "data": "Path not found"})
             return
 
-        async def list_files():
-            locked_files = ["server.json", "server.log", "server.jar", "eula.txt"]
-            files = []
-            for entry in base_path.rglob("*"):
-                if entry.name in locked_files:
-                    continue
-                try:
-                    stat = entry.stat()
-                    files.append(
-                        {
-                            "path": str(entry.relative_to(server.path)).replace("\\", "/"),
-                            "name": entry.name,
-                            "type": "directory" if entry.is_dir() else "file",
-                            "size": stat.st_size if not entry.is_dir() else None,
-                            "modified": datetime.fromtimestamp(
-                                stat.st_mtime
-                            ).isoformat(),
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing {entry}: {e}")
-            return sorted(files, key=lambda x: (x["type"] == "file", x["name"].lower()))
-
-        # Send initial list
-        await websocket.send_json({"type": "file_init", "data": await list_files()})
+        def describe(path: str, st: os.stat_result) -> Tuple[Tuple[bool, str], dict]:
+            """Return (sort key, file entry); the sort key is computed once here"""
+            is_dir = S_ISDIR(st.st_mode)
+            name = os.path.basename(path)
+            return (not is_dir, name.lower()), {
+                "path": os.path.relpath(path, server.path).replace("\\", "/"),
+                "name": name,
+                "type": "directory" if is_dir else "file",
+                "size": None if is_dir else st.st_size,
+                "modified": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.localtime(st.st_mtime)
+                ),
+            }
 
-        # Watch directory for changes
-        async for changes in awatch(base_path):
+        def build_index() -> Dict[str, Tuple[Tuple[bool, str], dict]]:
+            # scandir entries carry their stat data from the directory read,
+            # so each file costs one syscall instead of rglob's two
+            index = {}
+            pending = [str(base_path)]
+            while pending:
+                directory = pending.pop()
+                try:
+                    entries = os.scandir(directory)
+                except OSError as e:
+                    print(f"Error processing {directory}: {e}")
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.name in _LOCKED_FILES:
+                            continue
+                        try:
+                            record = describe(entry.path, entry.stat(follow_symlinks=False))
+                            index[record[1]["path"]] = record
+                            if record[1]["type"] == "directory":
+                                pending.append(entry.path)
+                        except Exception as e:
+                            print(f"Error processing {entry.path}: {e}")
+            return index
+
+        def list_files() -> List[dict]:
+            return [item for _, item in sorted(index.values(), key=itemgetter(0))]
+
+        def drop(rel_path: str):
+            index.pop(rel_path, None)
+            prefix = rel_path + "/"
+            for key in [k for k in index if k.startswith(prefix)]:
+                del index[key]
+
+        # Build the index once, then keep it up to date from the change sets
+        index = await asyncio.to_thread(build_index)
+        send({"type": "file_init", "data": list_files()})
+
+        # Watch directory for changes; awatch stops when the task is cancelled
+        async for changes in awatch(
+            base_path, watch_filter=ServerFileFilter(), debounce=1000, step=200
+        ):
             events = []
             for change_type, file_path in changes:
-                events.append(
-                    {
-                        "event": change_type.name,
-                        "path": os.path.relpath(file_path, server.path),
-                    }
-                )
-            await websocket.send_json(
+                rel_path = os.path.relpath(file_path, server.path)
+                events.append({"event": change_type.name, "path": rel_path})
+
+                if os.path.basename(file_path) in _LOCKED_FILES:
+                    continue
+                key = rel_path.replace("\\", "/")
+                if change_type == Change.deleted:
+                    drop(key)
+                    continue
+                try:
+                    st = await asyncio.to_thread(os.stat, file_path, follow_symlinks=False)
+                    index[key] = describe(file_path, st)
+                except FileNotFoundError:
+                    drop(key)
+                except Exception as e:
+                    print(f"Error processing {file_path}: {e}")
+            send(
                 {
                     "type": "file_update",
                     "changes": events,
-                    "data": await list_files(),
+                    "data": list_files(),
                 }
             )
 
+    actions = {
+        "start": start_server,
+        "restart": restart_server,
+        "stop": stop_server,
+    }
+
     async def handle_messages():
+        nonlocal last_pong
+        # Actions run as websocket.state.user; never call get_current_user here
         try:
             while True:
                 data = await websocket.receive_json()
                 msg_type = data.get("action", "")
                 if msg_type == "pong":
-                    continue
-                elif msg_type == "start":
-                    await start_server()
-                elif msg_type == "restart":
-                    await restart_server()
-                elif msg_type == "stop":
-                    await stop_server()
+                    last_pong = time.monotonic()
                 elif msg_type == "command":
                     await send_command(data.get("data", ""))
-                else:
-                    continue
+                elif handler := actions.get(msg_type):
+                    await handler()
         except WebSocketDisconnect:
             logger.info("Client disconnected")
+            raise SessionClosed()
         except Exception as e:
             logger.warning(f"Message handling error: {e}")
-
-    # --- Start tasks ---
-    heartbeat_task = asyncio.create_task(send_heartbeat())
-    message_task = asyncio.create_task(handle_messages())
-    watch_task = asyncio.create_task(watch_files())
+            raise SessionClosed()
 
     try:
         await get_server_info()
 
         if not accepted_eula():
-            await websocket.send_json({"type": "need_eula"})
+            send({"type": "need_eula"})
 
         logger.info("WebSocket connection established")
-        done, pending = await asyncio.wait(
-            [heartbeat_task, message_task],
-            return_when=asyncio.FIRST_COMPLETED,
-        )
+        # The first task to fail (a disconnect included) cancels the others,
+        # so the file watcher never outlives the connection
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(writer())
+            tg.create_task(send_heartbeat())
+            tg.create_task(handle_messages())
+            tg.create_task(watch_files())
 
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+    except* SessionClosed:
+        pass
 
-    except Exception as e:
-        logger.warning(f"WebSocket error: {e}")
+    except* Exception as e:
+        logger.warning(f"WebSocket error: {e.exceptions}")
 
     finally:
-        for task in [heartbeat_task, message_task]:
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-
+        closed = True
+        # The server keeps calling its output callback after we are gone
+        if getattr(server, "output_callback", None) is send_to_websocket:
+            server.set_output_callback(None)
         try:
             server.remove_websocket(websocket)
             await websocket.close()
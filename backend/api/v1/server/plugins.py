@@ -1,7 +1,8 @@
-from fastapi import APIRouter, HTTPException, Request
+import os
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Optional
 from pydantic import BaseModel
-from ..auth import get_current_user
+from ..auth import User, get_current_user
 from .utils import get_server_instance
 
 router = APIRouter(tags=["plugins"])
@@ -13,10 +14,8 @@ class PluginInfo(BaseModel):
     description: Optional[str]
 
 @router.get("/{server_name}/plugins", response_model=List[PluginInfo])
-async def list_plugins(request: Request, server_name: str):
+async def list_plugins(server_name: str, current_user: User = Depends(get_current_user)):
     """List installed plugins"""
-    current_user = await get_current_user(request)
-    
     try:
         server = await get_server_instance(server_name)
         plugins_dir = server.path / "plugins"
@@ -25,17 +24,20 @@ async def list_plugins(request: Request, server_name: str):
             return []
             
         plugins = []
-        for jar in plugins_dir.glob("*.jar"):
-            try:
-                plugins.append(PluginInfo(
-                    name=jar.stem,
-                    version="Unknown",
-                    enabled=True,
-                    description=None
-               ))
-            except Exception as e:
-                print(f"Error processing plugin {jar}: {e}")
-                continue
+        with os.scandir(plugins_dir) as entries:
+            for jar in entries:
+                if not jar.name.endswith(".jar"):
+                    continue
+                try:
+                    plugins.append(PluginInfo(
+                        name=jar.name[:-4],
+                        version="Unknown",
+                        enabled=True,
+                        description=None
+                   ))
+                except Exception as e:
+                    print(f"Error processing plugin {jar.path}: {e}")
+                    continue
                 
         return plugins
     except Exception as e:
@@ -1,27 +1,55 @@
-from typing import Dict, Any, Optional
-import time
-from modules.servers import Server
+import asyncio
+from collections import OrderedDict, defaultdict
+from typing import DefaultDict, Dict, Any, Optional
+from cachetools import TTLCache
+from modules.servers import Server, ServerStatus
 
-_server_instances: Dict[str, Server] = {}
-_server_details_cache: Dict[str, Any] = {}
 _cache_duration = 5
+_max_instances = 64
+
+_server_instances: "OrderedDict[str, Server]" = OrderedDict()
+_instance_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+_server_details_cache: TTLCache = TTLCache(maxsize=256, ttl=_cache_duration)
+_inflight: Dict[str, asyncio.Future] = {}
+
+def _evict_instances():
+    """Drop least recently used instances above the cap, never one still in use"""
+    for name in list(_server_instances):
+        if len(_server_instances) <= _max_instances:
+            break
+        server = _server_instances[name]
+        if getattr(server, "status", ServerStatus.OFFLINE) != ServerStatus.OFFLINE:
+            continue
+        # A connected websocket still holds this instance; evicting it would
+        # let the next lookup build a second Server for the same name
+        if getattr(server, "websockets", None):
+            continue
+        del _server_instances[name]
+        lock = _instance_locks.get(name)
+        if lock is not None and not lock.locked():
+            del _instance_locks[name]
 
 async def get_server_instance(server_name: str) -> Server:
     """Get a cached server instance or create a new one if it doesn't exist"""
-    if server_name not in _server_instances:
-        _server_instances[server_name] = await Server.init(server_name)
-    return _server_instances[server_name]
+    server = _server_instances.get(server_name)
+    if server is None:
+        async with _instance_locks[server_name]:
+            server = _server_instances.get(server_name)
+            if server is None:
+                server = await Server.init(server_name)
+                _server_instances[server_name] = server
+                _evict_instances()
+    if server_name in _server_instances:
+        _server_instances.move_to_end(server_name)
+    return server
 
-async def process_server(server_name: str) -> Optional[dict]:
-    """Process a single server and return its details"""
+async def _load_server_details(server_name: str) -> Optional[dict]:
+    """Fetch fresh details for a single server and store them in the cache"""
     try:
-        current_time = time.time()
-        if (server_name in _server_details_cache and 
-            current_time - _server_details_cache[server_name]["timestamp"] < _cache_duration):
-            return _server_details_cache[server_name]["data"]
-        
         server = await get_server_instance(server_name)
-        metrics = await server.get_metrics(True)
+        metrics, players = await asyncio.gather(
+            server.get_metrics(True), server.players
+        )
         
         response = {
             "name": server.name,
@@ -31,16 +59,34 @@ async def process_server(server_name: str) -> Optional[dict]:
             "metrics": metrics if isinstance(metrics, dict) else metrics.__dict__,
             "port": server.port,
             "maxPlayers": server.players_limit,
-            "players": await server.players,
+            "players": players,
             "ip": server.ip
         }
         
-        _server_details_cache[server_name] = {
-            "data": response,
-            "timestamp": current_time
-        }
+        _server_details_cache[server_name] = response
         
         return response
     except Exception as e:
         print(f"Error processing server {server_name}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+async def process_server(server_name: str) -> Optional[dict]:
+    """Process a single server and return its details"""
+    cached = _server_details_cache.get(server_name)
+    if cached is not None:
+        return cached
+
+    # Concurrent callers for the same server share a single fetch
+    if server_name in _inflight:
+        return await asyncio.shield(_inflight[server_name])
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[server_name] = future
+    try:
+        response = await _load_server_details(server_name)
+        future.set_result(response)
+        return response
+    finally:
+        _inflight.pop(server_name, None)
+        if not future.done():
+            future.cancel()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import asyncio
+from contextlib import asynccontextmanager
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -10,9 +11,42 @@ from fastapi.staticfiles import StaticFiles
 import uvicorn
 import logging
 from api.v1 import router as api_v1_router
+from api.v1.server.utils import get_server_instance
+from modules.servers import get_servers
+from modules.jar import MinecraftServerDownloader
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 
+
+async def warm_server_instances():
+    """Load every server up front so the first request for each one is a cache hit"""
+    names = await asyncio.to_thread(get_servers)
+    results = await asyncio.gather(
+        *(get_server_instance(name) for name in names), return_exceptions=True
+    )
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logging.getLogger("bot").warning(f"Failed to load server {name}: {result}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm caches on startup and release shared connections on shutdown"""
+    # Fill the version list caches in the background so startup isn't held up by the network
+    app.state.warm_versions = asyncio.create_task(
+        asyncio.to_thread(MinecraftServerDownloader().warm_caches)
+    )
+    await warm_server_instances()
+    yield
+    # Close the connection pool shared by every Modrinth client; imported here
+    # so the Modrinth HTTP stack stays lazily loaded
+    from modules.modrinth.http import HTTPClient
+
+    await HTTPClient.shutdown()
+
 # Create the FastAPI app at module level
 app = FastAPI(
     title="MineGimme API",
@@ -21,6 +55,7 @@ app = FastAPI(
     # Disable automatic redirects for routes with/without trailing slashes
     redirect_slashes=False,
     docs_url=None,  # Disable default docs URL
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -77,7 +112,11 @@ class APIServer:
         config = uvicorn.Config(
             app=self.app,
             host=self.config.host,
-            port=self.config.port
+            port=self.config.port,
+            loop="uvloop" if uvloop else "asyncio",
+            http="httptools",
+            ws="websockets",
+            lifespan="on",
         )
         server = uvicorn.Server(config)
         try:
@@ -91,7 +130,10 @@ if __name__ == "__main__":
     config = APIConfig()
     server = APIServer(config)
     try:
-        asyncio.run(server.start())
+        # serve() runs on the caller's loop, so uvloop has to be chosen here
+        asyncio.run(
+            server.start(), loop_factory=uvloop.new_event_loop if uvloop else None
+        )
     except KeyboardInterrupt:
         pass
     except Exception as e:
@@ -1,23 +1,150 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import StrEnum
+import asyncio
 import os
+import sys
+import threading
+import hashlib
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import ijson
+import orjson
 import time
 from rich import print
 from rich.progress import Progress, DownloadColumn, TransferSpeedColumn
 import logging
 import shutil
 from pathlib import Path
+from operator import itemgetter
 
-# Set up a dedicated logger for the JAR module
-logging.basicConfig(level=logging.INFO)
+# Set up a dedicated logger for the JAR module; it writes to its own file only
 jar_logger = logging.getLogger("jar_downloader")
+jar_logger.setLevel(logging.INFO)
+jar_logger.propagate = False
 
-# Create a file handler for the jar downloader
-os.makedirs("logs", exist_ok=True)
-file_handler = logging.FileHandler("logs/jar_downloader.log")
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-jar_logger.addHandler(file_handler)
+if not jar_logger.handlers:
+    os.makedirs("logs", exist_ok=True)
+    file_handler = logging.FileHandler("logs/jar_downloader.log")
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    jar_logger.addHandler(file_handler)
+
+# (connect, read) timeouts for every request
+REQUEST_TIMEOUT = (5, 30)
+# Parsed cache entries shared by every downloader in the process: key -> (expires, content)
+MEMORY_CACHE_SIZE = 32
+_memory_cache = OrderedDict()
+_memory_cache_lock = threading.Lock()
+# Latest build numbers by (project, version): (expires, build)
+LATEST_BUILD_TTL = 600
+_latest_builds = {}
+# Lookup structures built from cached documents: key -> (document, value)
+_version_sets = {}
+# One keep-alive session shared by every downloader, so repeated API calls
+# reuse their connections even though callers create downloaders per request
+_session = requests.Session()
+_session_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+_session.mount("https://", _session_adapter)
+_session.mount("http://", _session_adapter)
+# Coalesce short network reads into large disk writes
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+# Files smaller than this are not worth splitting into ranged requests
+RANGED_MIN_SIZE = 8 * 1024 * 1024
+
+if hasattr(os, 'pwrite'):
+    def _write_at(fd, data, offset):
+        """Write all of data at offset without touching the shared file position"""
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+else:
+    # Windows has no pwrite, so positioned writes share one seek lock
+    _seek_lock = threading.Lock()
+
+    def _write_at(fd, data, offset):
+        """Write all of data at offset without touching the shared file position"""
+        view = memoryview(data)
+        with _seek_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while view:
+                view = view[os.write(fd, view):]
+
+class _ProgressWriter:
+    """File wrapper that reports every write to a rich progress task,
+    optionally hashing the bytes as they pass through"""
+
+    def __init__(self, f, progress, task, hasher=None):
+        self._file = f
+        self._progress = progress
+        self._task = task
+        self.hasher = hasher
+        self.written = 0
+
+    def write(self, data):
+        self._file.write(data)
+        if self.hasher:
+            self.hasher.update(data)
+        self.written += len(data)
+        self._progress.update(self._task, advance=len(data))
+
+class _LogProgress:
+    """Stand-in for rich's Progress without a terminal: logs every 5% instead of redrawing"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._total = None
+        self._done = 0
+        self._next_percent = 5
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_task(self, description, total=None):
+        self._total = total
+        return 0
+
+    def reset(self, task):
+        with self._lock:
+            self._done = 0
+            self._next_percent = 5
+
+    def update(self, task, total=None, advance=0):
+        with self._lock:
+            if total is not None:
+                self._total = total
+            self._done += advance
+            if not self._total:
+                return
+            percent = self._done * 100 // self._total
+            if percent >= self._next_percent:
+                jar_logger.info("Downloaded %s%% (%s of %s bytes)", percent, self._done, self._total)
+                self._next_percent = percent - percent % 5 + 5
+
+def _progress():
+    """Rich progress bar on an interactive terminal, periodic log lines otherwise"""
+    if sys.stdout.isatty() and not os.environ.get("VIRA_QUIET"):
+        return Progress(
+            *Progress.get_default_columns(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            refresh_per_second=4,
+        )
+    return _LogProgress()
 
 class ServerType(StrEnum):
     VANILLA = "vanilla"
@@ -39,332 +166,562 @@ class MinecraftServerDownloader:
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(self.versions_dir, exist_ok=True)
         
-        self._cache = {}
+        self._cache = _memory_cache
+        self._latest_builds = _latest_builds
+        self._version_sets = _version_sets
         self._cache_duration = 3600  # 1 hour cache
-        jar_logger.info(f"MinecraftServerDownloader initialized with versions directory: {self.versions_dir}")
+        self._builds_cache_duration = 300  # new builds land often, keep them for 5 minutes
+        self.session = _session
+        jar_logger.info("MinecraftServerDownloader initialized with versions directory: %s", self.versions_dir)
+
+    def _remember(self, cache_key, entry):
+        with _memory_cache_lock:
+            self._cache[cache_key] = entry
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > MEMORY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _load_cache_entry(self, cache_key):
+        """Return the cached entry for a key, fresh or stale, from memory or disk."""
+        with _memory_cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                self._cache.move_to_end(cache_key)
+                return entry
 
-    def _get_cached_data(self, cache_key):
         cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        jar_logger.debug(f"Checking for cached data: {cache_key}")
-        if os.path.exists(cache_file):
-            jar_logger.debug(f"Cache file exists: {cache_file}")
-            try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                    if time.time() - data['timestamp'] < self._cache_duration:
-                        jar_logger.debug(f"Using cached data for {cache_key}")
-                        return data['content']
-                    jar_logger.debug(f"Cache expired for {cache_key}")
-            except Exception as e:
-                jar_logger.error(f"Error reading cache file {cache_file}: {str(e)}")
-        else:
-            jar_logger.debug(f"No cache file found for {cache_key}")
-        return None
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = orjson.loads(f.read())
+        except FileNotFoundError:
+            jar_logger.debug("No cache file found for %s", cache_key)
+            return None
+        except Exception as e:
+            jar_logger.error("Error reading cache file %s: %s", cache_file, e)
+            return None
+        self._remember(cache_key, entry)
+        return entry
 
-    def _save_cache(self, cache_key, content):
+    def _save_cache(self, cache_key, content, etag=None, last_modified=None):
         cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        jar_logger.debug(f"Saving cache for {cache_key}")
+        jar_logger.debug("Saving cache for %s", cache_key)
+        entry = {
+            'timestamp': time.time(),
+            'content': content,
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+        self._remember(cache_key, entry)
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'timestamp': time.time(),
-                    'content': content
-                }, f)
-            jar_logger.debug(f"Cache saved successfully to {cache_file}")
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(entry))
+            jar_logger.debug("Cache saved successfully to %s", cache_file)
         except Exception as e:
-            jar_logger.error(f"Error saving cache to {cache_file}: {str(e)}")
+            jar_logger.error("Error saving cache to %s: %s", cache_file, e)
 
-    def _download_with_progress(self, url, filename):
-        jar_logger.info(f"Starting download from {url} to {filename}")
+    def _get_json(self, url, cache_key, duration=None, parse=None):
+        """GET a JSON document through the cache.
+        Stale entries are revalidated with a conditional request, so an unchanged
+        document only costs a 304. `parse` may stream the response body into the
+        content to cache instead of loading it whole. Returns None if the request fails."""
+        duration = duration or self._cache_duration
+        entry = self._load_cache_entry(cache_key)
+        if entry and time.time() - entry['timestamp'] < duration:
+            jar_logger.debug("Using cached data for %s", cache_key)
+            return entry['content']
+
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        with self.session.get(url, headers=headers, stream=parse is not None, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 304 and entry:
+                jar_logger.debug("%s not modified, refreshing cache timestamp", cache_key)
+                self._save_cache(cache_key, entry['content'], entry.get('etag'), entry.get('last_modified'))
+                return entry['content']
+            if response.status_code != 200:
+                jar_logger.error("Failed to fetch %s. Status code: %s", url, response.status_code)
+                return None
+
+            content = parse(response) if parse else orjson.loads(response.content)
+        self._save_cache(cache_key, content, response.headers.get('etag'), response.headers.get('last-modified'))
+        return content
+
+    def _parallel_get(self, urls):
+        """GET independent URLs concurrently and return the responses in order"""
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return list(executor.map(lambda url: self.session.get(url, timeout=REQUEST_TIMEOUT), urls))
+
+    def _download_ranged(self, url, filename, progress, task, parts=4):
+        """Download a file over parallel Range requests.
+        Returns the total size, or None if the server does not support ranges
+        or a range failed, in which case the caller falls back to a single stream."""
         try:
-            with Progress(
-                *Progress.get_default_columns(),
-                DownloadColumn(),
-                TransferSpeedColumn(),
-            ) as progress:
-                response = requests.get(url, stream=True)
-                if response.status_code != 200:
-                    jar_logger.error(f"Download failed with status code: {response.status_code}")
-                    return False
-                
-                total_size = int(response.headers.get('content-length', 0))
-                jar_logger.info(f"Download size: {total_size} bytes")
-                task = progress.add_task("[cyan]Downloading...", total=total_size)
-                
-                with open(filename, 'wb') as f:
-                    bytes_downloaded = 0
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            bytes_downloaded += len(chunk)
-                            progress.update(task, advance=len(chunk))
-                    
-                    jar_logger.info(f"Downloaded {bytes_downloaded} of {total_size} bytes to {filename}")
+            head = self.session.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            jar_logger.warning("HEAD request failed, using a single stream: %s", e)
+            return None
+        total_size = int(head.headers.get('content-length', 0))
+        if (
+            head.status_code != 200
+            or head.headers.get('accept-ranges') != 'bytes'
+            or total_size < RANGED_MIN_SIZE
+        ):
+            return None
+
+        jar_logger.info("Download size: %s bytes in %s ranges", total_size, parts)
+        progress.update(task, total=total_size)
+
+        # Every range writes straight to its final offset through one shared fd
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        completed = False
+        try:
+            try:
+                if hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(fd, 0, total_size)
+                else:
+                    os.ftruncate(fd, total_size)
+            except OSError as e:
+                # e.g. EOPNOTSUPP on filesystems without preallocation
+                jar_logger.warning("Could not preallocate %s, using a single stream: %s", filename, e)
+                return None
+
+            step = -(-total_size // parts)
+            failed = threading.Event()
+
+            def fetch(start, end):
+                with self.session.get(
+                    head.url, headers={'Range': f"bytes={start}-{end - 1}"}, stream=True, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    if response.status_code != 206:
+                        jar_logger.warning("Range request returned status code: %s", response.status_code)
+                        return False
+                    offset = start
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        if failed.is_set():
+                            return False
+                        _write_at(fd, chunk, offset)
+                        offset += len(chunk)
+                        # Progress.update takes rich's own lock
+                        progress.update(task, advance=len(chunk))
+                return True
+
+            with ThreadPoolExecutor(max_workers=parts) as executor:
+                futures = [
+                    executor.submit(fetch, start, min(start + step, total_size))
+                    for start in range(0, total_size, step)
+                ]
+                try:
+                    for future in as_completed(futures):
+                        if not future.result():
+                            break
+                    else:
+                        completed = True
+                except Exception as e:
+                    jar_logger.warning("Range download failed: %s", e)
+                finally:
+                    # Stop the remaining ranges if one of them failed or raised
+                    failed.set()
+                    for future in futures:
+                        future.cancel()
+        finally:
+            os.close(fd)
+            if not completed:
+                # Drop the partial file before the single-stream retry
+                try:
+                    os.remove(filename)
+                except OSError:
+                    pass
+        if not completed:
+            return None
+        return total_size
+
+    def _download_with_progress(self, url, filename, expected_sha1=None):
+        jar_logger.info("Starting download from %s to %s", url, filename)
+        try:
+            with _progress() as progress:
+                task = progress.add_task("[cyan]Downloading...", total=None)
+                total_size = self._download_ranged(url, filename, progress, task)
+                hasher = None
+
+                if total_size is None:
+                    # Ranges unsupported, fall back to a single stream
+                    progress.reset(task)
+                    with self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                        if response.status_code != 200:
+                            jar_logger.error("Download failed with status code: %s", response.status_code)
+                            return False
+
+                        total_size = int(response.headers.get('content-length', 0))
+                        jar_logger.info("Download size: %s bytes", total_size)
+                        progress.update(task, total=total_size)
+
+                        # Read the socket directly in 1 MiB blocks; only decode if the body is compressed
+                        response.raw.decode_content = 'content-encoding' in response.headers
+                        with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                            hasher = hashlib.sha1() if expected_sha1 else None
+                            writer = _ProgressWriter(f, progress, task, hasher)
+                            shutil.copyfileobj(response.raw, writer, 1024 * 1024)
+
+                            jar_logger.info("Downloaded %s of %s bytes to %s", writer.written, total_size, filename)
                 
                 # Verify the file was downloaded correctly
-                if os.path.exists(filename):
-                    file_size = os.path.getsize(filename)
-                    jar_logger.info(f"Verifying download: file size is {file_size} bytes")
-                    if total_size > 0 and file_size != total_size:
-                        jar_logger.warning(f"Download size mismatch! Expected {total_size}, got {file_size}")
-                else:
-                    jar_logger.error(f"Downloaded file {filename} does not exist!")
+                try:
+                    file_size = os.stat(filename).st_size
+                except FileNotFoundError:
+                    jar_logger.error("Downloaded file %s does not exist!", filename)
                     return False
+                jar_logger.info("Verifying download: file size is %s bytes", file_size)
+                if total_size > 0 and file_size != total_size:
+                    jar_logger.warning("Download size mismatch! Expected %s, got %s", total_size, file_size)
+
+                if expected_sha1:
+                    if hasher is None:
+                        # Ranges arrive out of order, so hash the finished file instead
+                        with open(filename, 'rb') as f:
+                            hasher = hashlib.file_digest(f, 'sha1')
+                    if hasher.hexdigest() != expected_sha1:
+                        jar_logger.error("Checksum mismatch for %s! Expected %s, got %s", filename, expected_sha1, hasher.hexdigest())
+                        os.remove(filename)
+                        return False
                 
                 return filename
         except Exception as e:
-            jar_logger.error(f"Error downloading file: {str(e)}")
+            jar_logger.error("Error downloading file: %s", e)
             return False
 
-    def get_vanilla_versions(self, include_snapshots=False):
-        """Get all available Vanilla Minecraft versions. Optionally include snapshots."""
-        jar_logger.info(f"Getting vanilla versions (include_snapshots={include_snapshots})")
-        cache_data = self._get_cached_data('vanilla_versions')
-        if cache_data:
-            jar_logger.info(f"Found {len(cache_data)} cached vanilla versions")
-            return cache_data
-        
+    def _derive(self, key, document, build):
+        """Build a lookup from a cached document once, until the document is replaced."""
+        cached = self._version_sets.get(key)
+        if cached and cached[0] is document:
+            return cached[1]
+        value = build()
+        self._version_sets[key] = (document, value)
+        return value
+
+    def _get_version_set(self, kind):
+        """Frozenset of every known version of a server type, for O(1) membership checks."""
         try:
-            response = requests.get(self.version_manifest_url)
-            if response.status_code == 200:
-                version_data = response.json()
-                if include_snapshots:
-                    versions = [v['id'] for v in version_data['versions']]
-                else:
-                    versions = [v['id'] for v in version_data['versions'] if v['type'] == 'release']
-                jar_logger.info(f"Retrieved {len(versions)} vanilla versions")
-                self._save_cache('vanilla_versions', versions)
-                return versions
+            if kind == 'paper':
+                document = self._get_json(f"{self.paper_api_url}/", 'paper_project')
+                build = lambda: frozenset(document['versions'])
+            elif kind == 'fabric':
+                document = self._get_json(f"{self.fabric_meta_url}/game", 'fabric_game')
+                build = lambda: frozenset(map(itemgetter('version'), document))
             else:
-                jar_logger.error(f"Failed to fetch Vanilla versions. Status code: {response.status_code}")
-                return []
+                document = self._get_json(self.purpur_api_url, 'purpur_project')
+                build = lambda: frozenset(document['versions'])
         except Exception as e:
-            jar_logger.error(f"Error fetching vanilla versions: {str(e)}")
+            jar_logger.error("Error fetching %s versions: %s", kind, e)
+            return frozenset()
+        if document is None:
+            return frozenset()
+        return self._derive((kind, 'versions'), document, build)
+
+    @staticmethod
+    def _parse_vanilla_manifest(response):
+        """Stream the manifest's version entries, keeping only the fields lookups use."""
+        response.raw.decode_content = True
+        return {
+            'versions': [
+                {'id': v['id'], 'type': v['type'], 'url': v['url']}
+                for v in ijson.items(response.raw, 'versions.item')
+            ]
+        }
+
+    def _get_vanilla_manifest(self):
+        """Get the Mojang version manifest, cached as a whole so lookups never refetch it."""
+        try:
+            return self._get_json(self.version_manifest_url, 'vanilla_manifest', parse=self._parse_vanilla_manifest)
+        except Exception as e:
+            jar_logger.error("Error fetching version manifest: %s", e)
+            return None
+
+    def get_vanilla_versions(self, include_snapshots=False):
+        """Get all available Vanilla Minecraft versions. Optionally include snapshots."""
+        jar_logger.info("Getting vanilla versions (include_snapshots=%s)", include_snapshots)
+        manifest = self._get_vanilla_manifest()
+        if not manifest:
             return []
+        get_id = itemgetter('id')
+        entries = manifest['versions']
+        if include_snapshots:
+            versions = list(map(get_id, entries))
+        else:
+            versions = [get_id(v) for v in entries if v['type'] == 'release']
+        jar_logger.info("Retrieved %s vanilla versions", len(versions))
+        return versions
+
+    def warm_caches(self):
+        """Fetch all four upstream version lists in parallel so the first lookup is a cache hit."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.get_vanilla_versions, True),
+                executor.submit(self.get_paper_versions),
+                executor.submit(self.get_fabric_versions, True),
+                executor.submit(self.get_purpur_versions),
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    jar_logger.warning("warm_caches: %s", e)
 
     def downloadVanilla(self, version: str):
-        jar_logger.info(f"Downloading vanilla version {version}")
-        versions = self.get_vanilla_versions(True)
+        jar_logger.info("Downloading vanilla version %s", version)
+        manifest = self._get_vanilla_manifest()
+        if not manifest:
+            return False
         version = str(version)
-        if version not in versions:
-            jar_logger.error(f"Version {version} not found in available versions")
+        index = self._derive(('vanilla', 'index'), manifest, lambda: {v['id']: v for v in manifest['versions']})
+        version_data = index.get(version)
+        if not version_data:
+            jar_logger.error("Version %s not found in available versions", version)
             return False
         
         try:
-            response = requests.get(self.version_manifest_url)
-            if response.status_code == 200:
-                version_data = next((v for v in response.json()['versions'] if v['id'] == version), None)
-                if not version_data:
-                    jar_logger.error(f"Version {version} not found in manifest")
-                    return False
-                version_url = version_data['url']
-                jar_logger.debug(f"Found version URL: {version_url}")
-            else:
-                jar_logger.error(f"Failed to fetch version manifest. Status code: {response.status_code}")
-                return False
-            
-            response = requests.get(version_url)
+            version_url = version_data['url']
+            jar_logger.debug("Found version URL: %s", version_url)
+
+            response = self.session.get(version_url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                server_url = response.json()["downloads"]["server"]["url"]
-                jar_logger.debug(f"Found server download URL: {server_url}")
+                server = orjson.loads(response.content)["downloads"]["server"]
+                server_url = server["url"]
+                jar_logger.debug("Found server download URL: %s", server_url)
             else:
-                jar_logger.error(f"Failed to fetch version data. Status code: {response.status_code}")
+                jar_logger.error("Failed to fetch version data. Status code: %s", response.status_code)
                 return False
             
             jar_file = f"versions/vanilla-{version}.jar"
-            result = self._download_with_progress(server_url, jar_file)
-            jar_logger.info(f"Download result: {result}")
+            result = self._download_with_progress(server_url, jar_file, expected_sha1=server.get("sha1"))
+            jar_logger.info("Download result: %s", result)
             return result
         except Exception as e:
-            jar_logger.error(f"Error in downloadVanilla: {str(e)}")
+            jar_logger.error("Error in downloadVanilla: %s", e)
             return False
 
     def get_paper_versions(self):
         """Get all available Paper versions."""
         jar_logger.info("Getting Paper versions")
-        cache_data = self._get_cached_data('paper_versions')
-        if cache_data:
-            jar_logger.info(f"Found {len(cache_data)} cached Paper versions")
-            return cache_data
-
         try:
-            response = requests.get(f"{self.paper_api_url}/")
-            if response.status_code == 200:
-                version_data = response.json()
-                versions = version_data['versions']
-                versions.reverse()
-                jar_logger.info(f"Retrieved {len(versions)} Paper versions")
-                self._save_cache('paper_versions', versions)
-                return versions
-            else:
-                jar_logger.error(f"Failed to fetch Paper versions. Status code: {response.status_code}")
+            version_data = self._get_json(f"{self.paper_api_url}/", 'paper_project')
+            if not version_data:
                 return []
+            versions = version_data['versions'][::-1]
+            jar_logger.info("Retrieved %s Paper versions", len(versions))
+            return versions
         except Exception as e:
-            jar_logger.error(f"Error fetching Paper versions: {str(e)}")
+            jar_logger.error("Error fetching Paper versions: %s", e)
             return []
     
+    def _get_latest_build(self, project, version):
+        entry = self._latest_builds.get((project, version))
+        if entry and entry[0] > time.time():
+            return entry[1]
+        return None
+
+    def _set_latest_build(self, project, version, build):
+        self._latest_builds[(project, version)] = (time.time() + LATEST_BUILD_TTL, build)
+
+    def _get_latest_paper_build(self, version):
+        """Get the latest Paper build number for a version, memoized for a few minutes."""
+        build_number = self._get_latest_build('paper', version)
+        if build_number is not None:
+            return build_number
+
+        api_url = f"https://api.papermc.io/v2/projects/paper/versions/{version}/builds"
+        jar_logger.debug("Fetching builds from: %s", api_url)
+        build_data = self._get_json(api_url, f"paper_builds_{version}", self._builds_cache_duration)
+        if build_data is None:
+            return None
+
+        builds = build_data["builds"]
+        if not builds:
+            jar_logger.error("No builds found for Paper version %s", version)
+            return None
+
+        build_number = builds[-1]['build']
+        self._set_latest_build('paper', version, build_number)
+        return build_number
+
     def downloadPaper(self, version: str, build='latest'):
-        jar_logger.info(f"Downloading Paper version {version} (build={build})")
-        versions = self.get_paper_versions()
+        jar_logger.info("Downloading Paper version %s (build=%s)", version, build)
         version = str(version)
-        if version not in versions:
-            jar_logger.error(f"Version {version} not found in available Paper versions")
+        if version not in self._get_version_set('paper'):
+            jar_logger.error("Version %s not found in available Paper versions", version)
             return False
         
         try:
-            api_url = f"https://api.papermc.io/v2/projects/paper/versions/{version}/builds"
-            jar_logger.debug(f"Fetching builds from: {api_url}")
-            response = requests.get(api_url)
-        
-            if response.status_code == 200:
-                builds = response.json()["builds"]
-                if not builds:
-                    jar_logger.error(f"No builds found for Paper version {version}")
-                    return False
-                
-                latest_build = builds[-1]
-                build_number = latest_build['build']
-                jar_logger.info(f"Using build {build_number} for Paper version {version}")
-                
-                download_url = f"https://api.papermc.io/v2/projects/paper/versions/{version}/builds/{build_number}/downloads/paper-{version}-{build_number}.jar"
-                jar_file = f"versions/paper-{version}-{build_number}.jar"
-                
-                jar_logger.debug(f"Downloading from: {download_url}")
-                result = self._download_with_progress(download_url, jar_file)
-                jar_logger.info(f"Download result: {result}")
-                return result
-            else:
-                jar_logger.error(f"Failed to fetch Paper builds. Status code: {response.status_code}")
+            build_number = self._get_latest_paper_build(version)
+            if build_number is None:
                 return False
+            jar_logger.info("Using build %s for Paper version %s", build_number, version)
+            
+            download_url = f"https://api.papermc.io/v2/projects/paper/versions/{version}/builds/{build_number}/downloads/paper-{version}-{build_number}.jar"
+            jar_file = f"versions/paper-{version}-{build_number}.jar"
+            
+            jar_logger.debug("Downloading from: %s", download_url)
+            result = self._download_with_progress(download_url, jar_file)
+            jar_logger.info("Download result: %s", result)
+            return result
         except Exception as e:
-            jar_logger.error(f"Error in downloadPaper: {str(e)}")
+            jar_logger.error("Error in downloadPaper: %s", e)
             return False
 
     def get_fabric_versions(self, include_snapshots=False):
         """Get all available Minecraft versions supported by Fabric. Optionally include snapshots."""
-        jar_logger.info(f"Getting Fabric versions (include_snapshots={include_snapshots})")
-        cache_data = self._get_cached_data('fabric_versions')
-        if cache_data:
-            jar_logger.info(f"Found {len(cache_data)} cached Fabric versions")
-            return cache_data
-        
+        jar_logger.info("Getting Fabric versions (include_snapshots=%s)", include_snapshots)
         try:
-            response = requests.get(f"{self.fabric_meta_url}/game")
-            if response.status_code == 200:
-                version_data = response.json()
-                if include_snapshots:
-                    versions = version_data  # The API already returns a list of versions
-                else:
-                    versions = [v for v in version_data if v.get('stable', False)]
-                versions = [v['version'] for v in versions]
-                jar_logger.info(f"Retrieved {len(versions)} Fabric versions")
-                self._save_cache('fabric_versions', versions)
-                return versions
-            else:
-                jar_logger.error(f"Failed to fetch Fabric supported versions. Status code: {response.status_code}")
+            version_data = self._get_json(f"{self.fabric_meta_url}/game", 'fabric_game')
+            if version_data is None:
                 return []
+            if include_snapshots:
+                versions = version_data  # The API already returns a list of versions
+            else:
+                versions = [v for v in version_data if v.get('stable', False)]
+            versions = list(map(itemgetter('version'), versions))
+            jar_logger.info("Retrieved %s Fabric versions", len(versions))
+            return versions
         except Exception as e:
-            jar_logger.error(f"Error fetching Fabric versions: {str(e)}")
+            jar_logger.error("Error fetching Fabric versions: %s", e)
             return []
 
     def downloadFabric(self, version: str):
-        jar_logger.info(f"Downloading Fabric version {version}")
-        versions = self.get_fabric_versions(True)
+        jar_logger.info("Downloading Fabric version %s", version)
         version = str(version)
-        if version not in versions:
-            jar_logger.error(f"Version {version} not found in available Fabric versions")
+        if version not in self._get_version_set('fabric'):
+            jar_logger.error("Version %s not found in available Fabric versions", version)
             return False
 
         try:
-            # Get the latest loader version
+            # Get the latest loader and installer versions; the two lookups are independent
             loader_url = f"{self.fabric_meta_url}/loader/{version}"
-            jar_logger.debug(f"Fetching loader version from: {loader_url}")
-            loader_response = requests.get(loader_url)
+            installer_url = f"{self.fabric_meta_url}/installer"
+            jar_logger.debug("Fetching loader and installer versions from: %s, %s", loader_url, installer_url)
+            loader_response, installer_response = self._parallel_get([loader_url, installer_url])
             if loader_response.status_code != 200:
-                jar_logger.error(f"Failed to fetch Fabric loader versions. Status code: {loader_response.status_code}")
+                jar_logger.error("Failed to fetch Fabric loader versions. Status code: %s", loader_response.status_code)
                 return False
 
-            loader_data = loader_response.json()
+            loader_data = orjson.loads(loader_response.content)
             if not loader_data:
-                jar_logger.error(f"No Fabric loader found for version {version}")
+                jar_logger.error("No Fabric loader found for version %s", version)
                 return False
 
             loader_version = loader_data[0]['loader']['version']
-            jar_logger.info(f"Using Fabric loader version: {loader_version}")
+            jar_logger.info("Using Fabric loader version: %s", loader_version)
 
-            # Get the latest installer version
-            installer_url = f"{self.fabric_meta_url}/installer"
-            jar_logger.debug(f"Fetching installer version from: {installer_url}")
-            installer_response = requests.get(installer_url)
             if installer_response.status_code != 200:
-                jar_logger.error(f"Failed to fetch Fabric installer versions. Status code: {installer_response.status_code}")
+                jar_logger.error("Failed to fetch Fabric installer versions. Status code: %s", installer_response.status_code)
                 return False
 
-            installer_data = installer_response.json()
+            installer_data = orjson.loads(installer_response.content)
             if not installer_data:
                 jar_logger.error("No Fabric installer versions found")
                 return False
 
             installer_version = installer_data[0]['version']
-            jar_logger.info(f"Using Fabric installer version: {installer_version}")
+            jar_logger.info("Using Fabric installer version: %s", installer_version)
 
             # Construct the download URL for the Fabric server launcher
             download_url = f"https://meta.fabricmc.net/v2/versions/loader/{version}/{loader_version}/{installer_version}/server/jar"
-            jar_logger.debug(f"Downloading from: {download_url}")
+            jar_logger.debug("Downloading from: %s", download_url)
             
             filename = f"versions/fabric-server-mc{version}-loader{loader_version}-launcher{installer_version}.jar"
             result = self._download_with_progress(download_url, filename)
-            jar_logger.info(f"Download result: {result}")
+            jar_logger.info("Download result: %s", result)
             return result
         except Exception as e:
-            jar_logger.error(f"Error in downloadFabric: {str(e)}")
+            jar_logger.error("Error in downloadFabric: %s", e)
             return False
 
     def get_purpur_versions(self):
         """Get all available Purpur versions."""
         jar_logger.info("Getting Purpur versions")
-        cache_data = self._get_cached_data('purpur_versions')
-        if cache_data:
-            jar_logger.info(f"Found {len(cache_data)} cached Purpur versions")
-            return cache_data
-
         try:
-            response = requests.get(self.purpur_api_url)
-            if response.status_code == 200:
-                versions = response.json()['versions']
-                jar_logger.info(f"Retrieved {len(versions)} Purpur versions")
-                self._save_cache('purpur_versions', versions)
-                return versions
-            else:
-                jar_logger.error(f"Failed to fetch Purpur versions. Status code: {response.status_code}")
+            version_data = self._get_json(self.purpur_api_url, 'purpur_project')
+            if not version_data:
                 return []
+            # Copy so callers can't mutate the cached document
+            versions = list(version_data['versions'])
+            jar_logger.info("Retrieved %s Purpur versions", len(versions))
+            return versions
         except Exception as e:
-            jar_logger.error(f"Error fetching Purpur versions: {str(e)}")
+            jar_logger.error("Error fetching Purpur versions: %s", e)
             return []
 
+    def _get_latest_purpur_build(self, version):
+        """Get the latest Purpur build number for a version, memoized for a few minutes."""
+        build = self._get_latest_build('purpur', version)
+        if build is not None:
+            return build
+
+        response = self.session.get(f"{self.purpur_api_url}/{version}/latest", timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            jar_logger.error("Failed to fetch latest build")
+            return None
+        build = orjson.loads(response.content)['build']
+        self._set_latest_build('purpur', version, build)
+        return build
+
     def downloadPurpur(self, version: str, build='latest'):
         """Download Purpur server jar."""
-        jar_logger.info(f"Downloading Purpur version {version} (build={build})")
-        versions = self.get_purpur_versions()
-        if version not in versions:
-            jar_logger.error(f"Version {version} not found in available Purpur versions")
+        jar_logger.info("Downloading Purpur version %s (build=%s)", version, build)
+        version = str(version)
+        if version not in self._get_version_set('purpur'):
+            jar_logger.error("Version %s not found in available Purpur versions", version)
             return False
 
         try:
             if build == 'latest':
-                response = requests.get(f"{self.purpur_api_url}/{version}/latest")
-                if response.status_code != 200:
-                    jar_logger.error("Failed to fetch latest build")
+                build = self._get_latest_purpur_build(version)
+                if build is None:
                     return False
-                build = response.json()['build']
-                jar_logger.info(f"Using latest build: {build}")
+                jar_logger.info("Using latest build: %s", build)
 
             download_url = f"{self.purpur_api_url}/{version}/{build}/download"
             filename = f"versions/purpur-{version}-{build}.jar"
-            jar_logger.debug(f"Downloading from: {download_url}")
+            jar_logger.debug("Downloading from: %s", download_url)
             result = self._download_with_progress(download_url, filename)
-            jar_logger.info(f"Download result: {result}")
+            jar_logger.info("Download result: %s", result)
             return result
         except Exception as e:
-            jar_logger.error(f"Error in downloadPurpur: {str(e)}")
-            return False
\ No newline at end of file
+            jar_logger.error("Error in downloadPurpur: %s", e)
+            return False
+
+
+class AsyncMinecraftServerDownloader:
+    """Awaitable front for MinecraftServerDownloader.
+
+    Each call runs the blocking downloader on a worker thread, so lookups and
+    downloads can be awaited and gathered from the event loop while sharing the
+    downloader's session and caches."""
+
+    def __init__(self, downloader: MinecraftServerDownloader | None = None):
+        self.downloader = downloader or MinecraftServerDownloader()
+
+    async def get_vanilla_versions(self, include_snapshots=False):
+        return await asyncio.to_thread(self.downloader.get_vanilla_versions, include_snapshots)
+
+    async def get_paper_versions(self):
+        return await asyncio.to_thread(self.downloader.get_paper_versions)
+
+    async def get_fabric_versions(self, include_snapshots=False):
+        return await asyncio.to_thread(self.downloader.get_fabric_versions, include_snapshots)
+
+    async def get_purpur_versions(self):
+        return await asyncio.to_thread(self.downloader.get_purpur_versions)
+
+    async def downloadVanilla(self, version: str):
+        return await asyncio.to_thread(self.downloader.downloadVanilla, version)
+
+    async def downloadPaper(self, version: str, build='latest'):
+        return await asyncio.to_thread(self.downloader.downloadPaper, version, build)
+
+    async def downloadFabric(self, version: str):
+        return await asyncio.to_thread(self.downloader.downloadFabric, version)
+
+    async def downloadPurpur(self, version: str, build='latest'):
+        return await asyncio.to_thread(self.downloader.downloadPurpur, version, build)
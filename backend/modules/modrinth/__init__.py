@@ -47,11 +47,59 @@ Advanced Usage:
     ...     versions = await client.get_game_version_tags()
 """
 
-from .client import *
-from .project import *
-from .tags import *
-from .utils import *
-from .versions import *
+import importlib
+
+# Public names and the submodule that defines them. Submodules (and aiohttp)
+# are only imported when one of their names is first accessed.
+_LAZY = {
+    "Client": ".client",
+    "HTTPClient": ".http",
+    "Project": ".project",
+    "Projects": ".project",
+    "SearchResult": ".project",
+    "GalleryItem": ".project",
+    "License": ".project",
+    "CategoryTag": ".tags",
+    "LoaderTag": ".tags",
+    "GameVersionTag": ".tags",
+    "Tags": ".tags",
+    "File": ".versions",
+    "Dependency": ".versions",
+    "Version": ".versions",
+    "VersionList": ".versions",
+    "Versions": ".versions",
+    "format_datetime": ".utils",
+    "validate_input": ".utils",
+    "validate_required": ".utils",
+    "MISSING": ".utils",
+    "ModrinthException": ".utils",
+    "RateLimitError": ".utils",
+    "AuthenticationError": ".utils",
+    "NotFoundError": ".utils",
+    "ValidationError": ".utils",
+    "ProjectType": ".utils",
+    "SideType": ".utils",
+    "ProjectStatus": ".utils",
+    "RequestedStatus": ".utils",
+    "MonetizationStatus": ".utils",
+    "VersionType": ".utils",
+    "DependencyType": ".utils",
+    "VersionStatus": ".utils",
+}
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
+
 __version__ = "1.0.0"
 __author__ = "Mahiro"
 __license__ = "MIT"
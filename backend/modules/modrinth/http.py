@@ -16,8 +16,11 @@ import aiohttp
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union, TypeVar
+import orjson
+import random
+import time
+from typing import List, Dict, Any, Optional, Set, Tuple, Union, TypeVar
+from cachetools import TTLCache
 from .utils import (
     MISSING,
     ModrinthException,
@@ -25,7 +28,6 @@ from .utils import (
     AuthenticationError,
     NotFoundError,
     ValidationError,
-    list_to_query_param,
     validate_input
 )
 
@@ -36,12 +38,21 @@ logger = logging.getLogger("modrinth.http")
 
 T = TypeVar('T')
 
+# Prebuilt (true, false) facet strings for the boolean search filters
+_BOOL_FACET_TEMPLATES = {
+    name: (f"{name}:true", f"{name}:false")
+    for name in ("open_source", "client_side", "server_side")
+}
+
 class RateLimiter:
-    """Handles API rate limiting."""
+    """Handles API rate limiting with a token bucket."""
     
     def __init__(self, calls_per_minute: int = 300):
         self.calls_per_minute = calls_per_minute
-        self.calls: List[datetime] = []
+        self.capacity = float(calls_per_minute)
+        self.rate = calls_per_minute / 60.0
+        self.tokens = self.capacity
+        self.last_refill: Optional[float] = None
         self._lock = asyncio.Lock()
     
     async def acquire(self):
@@ -49,19 +60,24 @@ class RateLimiter:
         Acquire permission to make an API call.
         Blocks if rate limit would be exceeded.
         """
-        async with self._lock:
-            now = datetime.now()
-            # Remove calls older than 1 minute
-            self.calls = [t for t in self.calls if now - t < timedelta(minutes=1)]
-            
-            if len(self.calls) >= self.calls_per_minute:
-                # Wait until oldest call is more than 1 minute old
-                wait_time = timedelta(minutes=1) - (now - self.calls[0])
-                if wait_time.total_seconds() > 0:
-                    logger.warning(f"Rate limit reached. Waiting {wait_time.total_seconds():.2f}s")
-                    await asyncio.sleep(wait_time.total_seconds())
-            
-            self.calls.append(now)
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                if self.last_refill is not None:
+                    # Refill tokens for the time elapsed since the last call
+                    elapsed = now - self.last_refill
+                    self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_time = (1 - self.tokens) / self.rate
+
+            # Sleep without the lock so other callers can re-check the bucket
+            logger.warning("Rate limit reached. Waiting %.2fs", wait_time)
+            await asyncio.sleep(wait_time)
 
 class HTTPClient:
     """
@@ -77,13 +93,33 @@ class HTTPClient:
         BASE_URL (str): Base URL for the Modrinth API
         DEFAULT_HEADERS (Dict[str, str]): Default headers sent with every request
         MAX_RETRIES (int): Maximum number of retry attempts for failed requests
+        MAX_BACKOFF (float): Upper bound in seconds for the wait between retries
+        DEFAULT_TIMEOUT (aiohttp.ClientTimeout): Timeout set on the shared session
     """
 
-    BASE_URL = "https://api.modrinth.com/v2"
+    BASE_URL = "https://api.modrinth.com/v2/"
     DEFAULT_HEADERS = {
         "User-Agent": "Voxely/1.0.0 (python-modrinth-api)"
     }
     MAX_RETRIES = 3
+    MAX_BACKOFF = 30.0
+    DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+    # Bytes of an unexpected response body to include in error messages
+    MAX_ERROR_BODY = 1024
+    # Single project lookups arriving within this window share one bulk request
+    PROJECT_BATCH_INTERVAL = 0.01
+    PROJECT_BATCH_SIZE = 50
+
+    # One connection pool for every client, since all traffic goes to the same host.
+    # It is closed when the last open client is closed, or by shutdown()
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _open_clients: int = 0
+
+    # Responses of GETs that rarely change, shared like the session.
+    # Tags only change with Modrinth deployments so they are kept longer
+    CACHEABLE_PREFIXES = ("project/", "projects", "tag/")
+    _response_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+    _tag_cache: TTLCache = TTLCache(maxsize=64, ttl=3600)
 
     def __init__(self, timeout: int = 30):
         """
@@ -92,28 +128,84 @@ class HTTPClient:
         Args:
             timeout (int): Request timeout in seconds
         """
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Only clients with a non-default timeout need to override it per request
+        self.timeout: Optional[aiohttp.ClientTimeout] = None
+        if timeout != self.DEFAULT_TIMEOUT.total:
+            self.timeout = aiohttp.ClientTimeout(
+                total=timeout,
+                connect=self.DEFAULT_TIMEOUT.connect,
+                sock_read=self.DEFAULT_TIMEOUT.sock_read,
+            )
         self.rate_limiter = RateLimiter()
-        self._initialize_session()
-    
-    def _initialize_session(self):
-        """Initialize the aiohttp ClientSession with default settings."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=self.timeout,
-                headers=self.DEFAULT_HEADERS
+        self._project_batch_queue: List[Tuple[str, asyncio.Future]] = []
+        self._project_batch_task: Optional[asyncio.Task] = None
+        self._project_batch_tasks: Set[asyncio.Task] = set()
+        self._response_reads: Set[asyncio.Task] = set()
+        self._closed = False
+        HTTPClient._open_clients += 1
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """
+        Return the shared ClientSession, creating it on first use.
+
+        Creation is deferred to the first request so that clients can be
+        constructed at import time, before an event loop is running. A session
+        left over from another event loop (e.g. an earlier asyncio.run) is
+        replaced, since its connections cannot be used from this one.
+        """
+        session = cls._shared_session
+        if (
+            session is None
+            or session.closed
+            or session._loop is not asyncio.get_running_loop()
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
             )
+            cls._shared_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=cls.DEFAULT_HEADERS,
+                timeout=cls.DEFAULT_TIMEOUT,
+                # The Modrinth API is stateless, so skip cookie handling entirely
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return cls._shared_session
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared session. Call once when the application exits."""
+        session = cls._shared_session
+        cls._shared_session = None
+        # A session from a finished event loop can't be closed from this one
+        if (
+            session is not None
+            and not session.closed
+            and session._loop is asyncio.get_running_loop()
+        ):
+            await session.close()
     
     async def close(self):
-        """Close the client session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """
+        Release the client.
+
+        The connection pool is shared between clients, so it is only closed
+        once every client has been closed. Long-lived clients that are never
+        closed keep it open until HTTPClient.shutdown().
+        """
+        if self._closed:
+            return
+        self._closed = True
+        HTTPClient._open_clients -= 1
+        if HTTPClient._open_clients == 0:
+            await self.shutdown()
 
     async def __aenter__(self):
         """Context manager entry."""
-        self._initialize_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -136,25 +228,41 @@ class HTTPClient:
             NotFoundError: When resource is not found
             ModrinthException: For other API errors
         """
+        status = response.status
+        if 200 <= status < 300:
+            if response.content_type != "application/json":
+                body = await response.content.read(self.MAX_ERROR_BODY)
+                raise ModrinthException(f"Invalid JSON response: {body.decode(errors='replace')}")
+            body = await response.read()
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                excerpt = body[:self.MAX_ERROR_BODY].decode(errors='replace')
+                raise ModrinthException(f"Invalid JSON response: {excerpt}")
+        if status == 404:
+            raise NotFoundError("Resource not found")
+        if status == 429:  # Rate limit exceeded
+            retry_after = int(response.headers.get('Retry-After', 60))
+            raise RateLimitError(
+                f"Rate limit exceeded. Retry after {retry_after} seconds",
+                retry_after=retry_after,
+            )
+        if status == 401:
+            raise AuthenticationError("Authentication failed")
+        raise ModrinthException(f"HTTP {status}: {response.reason}")
+
+    async def _read_response(self, response: aiohttp.ClientResponse) -> Any:
+        """Handle a response and release its connection."""
         try:
-            if response.status == 429:  # Rate limit exceeded
-                retry_after = int(response.headers.get('Retry-After', 60))
-                raise RateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds"
-                )
-            
-            response.raise_for_status()
-            return await response.json()
-            
-        except aiohttp.ContentTypeError:
-            text = await response.text()
-            raise ModrinthException(f"Invalid JSON response: {text}")
-        except aiohttp.ClientResponseError as e:
-            if e.status == 401:
-                raise AuthenticationError("Authentication failed")
-            elif e.status == 404:
-                raise NotFoundError("Resource not found")
-            raise ModrinthException(f"HTTP {e.status}: {e.message}")
+            return await self._handle_response(response)
+        finally:
+            response.release()
+
+    def _forget_read(self, task: asyncio.Task):
+        """Drop a finished response read, retrieving its error if nobody awaited it."""
+        self._response_reads.discard(task)
+        if not task.cancelled():
+            task.exception()
 
     async def _request(
         self, 
@@ -176,31 +284,55 @@ class HTTPClient:
         Raises:
             ModrinthException: For any API errors
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        if endpoint.startswith('/'):
+            endpoint = endpoint[1:]
+        url = self.BASE_URL + endpoint
         retries = 0
+        rate_limited = 0
+        session = await self._get_session()
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Build the query once so retries send exactly the same request.
+        # Modrinth expects list parameters as JSON arrays, e.g. ids=["a","b"]
+        if isinstance(params := kwargs.get("params"), dict):
+            final_params: List[Tuple[str, Any]] = [
+                (key, json.dumps(value) if isinstance(value, list) else value)
+                for key, value in params.items()
+            ]
+            kwargs["params"] = final_params
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+
+        cache = cache_key = None
+        if method == "GET" and endpoint.startswith(self.CACHEABLE_PREFIXES):
+            cache = self._tag_cache if endpoint.startswith("tag/") else self._response_cache
+            cache_key = (url, tuple(kwargs.get("params") or ()))
+            if (cached := cache.get(cache_key)) is not None:
+                return cached
         
         while True:
             try:
                 # Wait for rate limit
                 await self.rate_limiter.acquire()
-                if params := kwargs.get("params"):
-                    if isinstance(params, dict):
-                        for key, value in list(params.items()):  # Iterate over a copy of the items
-                            if isinstance(value, list):
-                                string = list_to_query_param(value, key)
-                                url += f"?{string}"
-                                params.pop(key)
                 
-                logger.info(f"Making {method} request to {url}")
-                logger.debug(f"Request params: {kwargs.get('params', {})}")
-                logger.debug(f"Request headers: {kwargs.get('headers', {})}")
+                logger.info("Making %s request to %s", method, url)
+                if debug:
+                    logger.debug("Request params: %s", kwargs.get('params', {}))
+                    logger.debug("Request headers: %s", kwargs.get('headers', {}))
                 
-                async with self.session.request(method, url, **kwargs) as response: # type: ignore
-                    logger.debug(f"Response status: {response.status}")
-                    logger.debug(f"Response headers: {dict(response.headers)}")
-                    response_data = await self._handle_response(response)
-                    logger.debug(f"Response data: {response_data}")
-                    return response_data
+                response = await session.request(method, url, **kwargs)
+                if debug:
+                    logger.debug("Response status: %s", response.status)
+                    logger.debug("Response headers: %s", response.headers)
+                # Finish reading even if the caller is cancelled, so the connection
+                # goes back to the pool instead of being dropped mid-body
+                read = asyncio.create_task(self._read_response(response))
+                self._response_reads.add(read)
+                read.add_done_callback(self._forget_read)
+                response_data = await asyncio.shield(read)
+                if cache is not None:
+                    cache[cache_key] = response_data
+                return response_data
                     
             except (
                 aiohttp.ServerConnectionError,
@@ -213,18 +345,93 @@ class HTTPClient:
                     logger.error(f"Max retries exceeded: {str(e)}")
                     raise ModrinthException(f"Max retries exceeded: {str(e)}")
                 
-                # Exponential backoff
-                wait_time = 2 ** retries
-                logger.info(f"Retrying in {wait_time} seconds...")
+                # Exponential backoff with jitter so concurrent failures don't retry in lockstep
+                wait_time = min(self.MAX_BACKOFF, random.uniform(0.5, 1.5) * (2 ** retries))
+                logger.info(f"Retrying in {wait_time:.2f} seconds...")
                 await asyncio.sleep(wait_time)
                 continue
                 
+            except RateLimitError as e:
+                rate_limited += 1
+                if rate_limited > self.MAX_RETRIES:
+                    logger.error(f"Rate limited too many times: {str(e)}")
+                    raise
+                # Empty the local bucket so other callers don't fire doomed requests meanwhile
+                self.rate_limiter.tokens = 0
+                logger.warning(f"Rate limited by the API, retrying in {e.retry_after} seconds")
+                await asyncio.sleep(e.retry_after)
+                continue
+
             except Exception as e:
                 logger.error(f"Request failed: {str(e)}", exc_info=True)
                 if isinstance(e, ModrinthException):
                     raise
                 raise ModrinthException(f"Request failed: {str(e)}")
 
+    async def _request_dict(
+        self, method: str, endpoint: str, description: str = "response", **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a request whose response must be a JSON object.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            endpoint (str): API endpoint (relative to BASE_URL)
+            description (str): What is being fetched, used in the error message
+            **kwargs: Additional arguments for the request
+
+        Raises:
+            ModrinthException: If the response is not an object
+        """
+        result = await self._request(method, endpoint, **kwargs)
+        if not isinstance(result, dict):
+            raise ModrinthException(f"Expected a dictionary response for {description}")
+        return result
+
+    async def _request_list(
+        self, method: str, endpoint: str, description: str = "response", **kwargs
+    ) -> List[Any]:
+        """
+        Make a request whose response must be a JSON array.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            endpoint (str): API endpoint (relative to BASE_URL)
+            description (str): What is being fetched, used in the error message
+            **kwargs: Additional arguments for the request
+
+        Raises:
+            ModrinthException: If the response is not an array
+        """
+        result = await self._request(method, endpoint, **kwargs)
+        if not isinstance(result, list):
+            raise ModrinthException(f"Expected a list response for {description}")
+        return result
+
+    async def _request_many(
+        self,
+        specs: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[Union[Dict[str, Any], List[Any]]]:
+        """
+        Make several independent requests concurrently.
+
+        The rate limiter is only held while taking a token, so the requests
+        share the connection pool and go out as fast as the bucket allows.
+        
+        Args:
+            specs (List[Tuple[str, str, Dict[str, Any]]]): (method, endpoint, kwargs)
+                for each request
+            
+        Returns:
+            List[Union[Dict[str, Any], List[Any]]]: Parsed responses, in the order of specs
+            
+        Raises:
+            ModrinthException: If any of the requests fails
+        """
+        return list(await asyncio.gather(
+            *(self._request(method, endpoint, **kwargs) for method, endpoint, kwargs in specs)
+        ))
+
     def _facets_to_list(
         self,
         versions: str = MISSING,
@@ -248,11 +455,10 @@ class HTTPClient:
         Returns:
             List[List[str]]: Formatted faceted search list
         """
-        facets = []
-        
-        if categories is not MISSING:
-            for category in categories:
-                facets.append([f"categories:{category}"])
+        facets = (
+            [[f"categories:{category}"] for category in categories]
+            if categories is not MISSING else []
+        )
         
         if versions is not MISSING:
             facets.append([f"versions:{versions}"])
@@ -260,20 +466,23 @@ class HTTPClient:
         if project_type is not MISSING:
             facets.append([f"project_type:{project_type}"])
         
-        if open_source is not MISSING:
-            facets.append([f"open_source:{'true' if client_side else 'false'}"])
-        
-        if client_side is not MISSING:
-            facets.append([f"client_side:{'true' if client_side else 'false'}"])
-        
-        if server_side is not MISSING:
-            facets.append([f"server_side:{'true' if server_side else 'false'}"])
+        for name, value in (
+            ("open_source", open_source),
+            ("client_side", client_side),
+            ("server_side", server_side),
+        ):
+            if value is not MISSING:
+                true_facet, false_facet = _BOOL_FACET_TEMPLATES[name]
+                facets.append([true_facet if value else false_facet])
         
         return facets
 
     async def _get_project(self, project_id: str) -> Dict[str, Any]:
         """
         Fetch a project by ID.
+
+        Concurrent calls are coalesced into a single bulk request, see
+        _flush_project_batch.
         
         Args:
             project_id (str): The project ID or slug
@@ -285,10 +494,75 @@ class HTTPClient:
             NotFoundError: If project is not found
         """
         validate_input(project_id, "project_id")
-        result = await self._request("GET", f"project/{project_id}")
-        if not isinstance(result, dict):
-            raise ModrinthException("Expected a dictionary response for project data")
-        return result
+        future = asyncio.get_running_loop().create_future()
+        self._project_batch_queue.append((project_id, future))
+
+        if len(self._project_batch_queue) >= self.PROJECT_BATCH_SIZE:
+            self._spawn_project_batch(self._take_project_batch())
+        elif self._project_batch_task is None:
+            self._project_batch_task = self._spawn_project_batch()
+        return await future
+
+    def _take_project_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Detach the queued project lookups."""
+        batch, self._project_batch_queue = self._project_batch_queue, []
+        return batch
+
+    def _spawn_project_batch(
+        self, batch: Optional[List[Tuple[str, asyncio.Future]]] = None
+    ) -> asyncio.Task:
+        """Run a batch now, or wait for the batch window when none is given."""
+        task = asyncio.create_task(self._flush_project_batch(batch))
+        self._project_batch_tasks.add(task)
+        task.add_done_callback(self._project_batch_tasks.discard)
+        return task
+
+    async def _flush_project_batch(
+        self, batch: Optional[List[Tuple[str, asyncio.Future]]] = None
+    ):
+        """
+        Resolve queued project lookups with one request.
+
+        Args:
+            batch (List[Tuple[str, asyncio.Future]], optional): Lookups to resolve.
+                When omitted, waits PROJECT_BATCH_INTERVAL and takes whatever is queued.
+        """
+        if batch is None:
+            await asyncio.sleep(self.PROJECT_BATCH_INTERVAL)
+            self._project_batch_task = None
+            batch = self._take_project_batch()
+        if not batch:
+            return
+
+        project_ids = list(dict.fromkeys(project_id for project_id, _ in batch))
+        try:
+            if len(project_ids) == 1:
+                projects = [await self._request_dict(
+                    "GET", f"project/{project_ids[0]}", description="project data"
+                )]
+            else:
+                projects = await self._get_projects(project_ids)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Callers may ask by ID or by (case-insensitive) slug
+        by_key: Dict[str, Dict[str, Any]] = {}
+        for project in projects:
+            by_key[project["id"]] = project
+            if slug := project.get("slug"):
+                by_key[slug.lower()] = project
+
+        for project_id, future in batch:
+            if future.done():
+                continue
+            project = by_key.get(project_id) or by_key.get(project_id.lower())
+            if project is None:
+                future.set_exception(NotFoundError("Resource not found"))
+            else:
+                future.set_result(project)
     
     async def _get_projects(self, project_ids: List[str]) -> List[Dict[str, Any]]:
         """
@@ -301,10 +575,9 @@ class HTTPClient:
             List[Dict[str, Any]]: List of project data
         """
         validate_input(project_ids, "project_ids")
-        result = await self._request("GET", "projects", params={"ids": project_ids})
-        if not isinstance(result, list):
-            raise ModrinthException("Expected a list response for project data")
-        return result
+        return await self._request_list(
+            "GET", "projects", params={"ids": project_ids}, description="project data"
+        )
 
     async def _search_project(
         self,
@@ -351,38 +624,25 @@ class HTTPClient:
         if facets:
             params["facets"] = facets
 
-        result = await self._request("GET", "search", params=params)
-        if not isinstance(result, dict):
-            raise ModrinthException("Expected a dictionary response for search results")
-        return result
+        return await self._request_dict(
+            "GET", "search", params=params, description="search results"
+        )
 
     async def _get_categories_tags(self) -> List[Dict[str, Any]]:
         """Fetch all category tags."""
-        result = await self._request("GET", "tag/category")
-        if not isinstance(result, list):
-            raise ModrinthException("Expected a list response for category tags")
-        return result
+        return await self._request_list("GET", "tag/category", description="category tags")
     
     async def _get_loader_tags(self) -> List[Dict[str, Any]]:
         """Fetch all loader tags."""
-        result = await self._request("GET", "tag/loader")
-        if not isinstance(result, list):
-            raise ModrinthException("Expected a list of dictionaries for loader tags")
-        return result
+        return await self._request_list("GET", "tag/loader", description="loader tags")
 
     async def _get_game_versions(self) -> List[Dict[str, Any]]:
         """Fetch all game versions."""
-        result = await self._request("GET", "tag/game_version")
-        if not isinstance(result, list):
-            raise ModrinthException("Expected a list of dictionaries for game versions")
-        return result
+        return await self._request_list("GET", "tag/game_version", description="game versions")
     
     async def _get_project_types(self) -> List[str]:
         """Fetch all project types."""
-        result = await self._request("GET", "tag/project_type")
-        if not isinstance(result, list):
-            raise ModrinthException("Expected a list of strings for project types")
-        return result
+        return await self._request_list("GET", "tag/project_type", description="project types")
 
     async def _get_version(self, version_id: str) -> Dict[str, Any]:
         """
@@ -399,10 +659,7 @@ class HTTPClient:
             ValidationError: If version_id is invalid
         """
         validate_input(version_id, "version_id")
-        result = await self._request("GET", f"version/{version_id}")
-        if not isinstance(result, dict):
-            raise ModrinthException("Expected a dictionary response for version data")
-        return result
+        return await self._request_dict("GET", f"version/{version_id}", description="version data")
     async def _get_versions(self, project_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Fetch all versions for a given project.
@@ -418,7 +675,6 @@ class HTTPClient:
             ValidationError: If the API returns invalid data
         """
         validate_input(project_ids, "project_ids")
-        result = await self._request("GET", f"versions", params={"ids": project_ids})
-        if not isinstance(result, list):
-            raise ModrinthException("Expected a list response for version data")
-        return result
\ No newline at end of file
+        return await self._request_list(
+            "GET", "versions", params={"ids": project_ids}, description="version data"
+        )
@@ -13,11 +13,10 @@ Example:
     ...         print(f"Found {project.title} by {project.team}")
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Union
 
 from datetime import datetime
-import aiohttp
-import os
+import asyncio
 import logging
 from .http import HTTPClient
 from .versions import *
@@ -30,14 +29,21 @@ from .utils import (
     RequestedStatus,
     SideType,
     format_datetime,
-    validate_input,
+    validate_required,
+    _parse_iso,
     ValidationError
 )
-from rich import print
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger("modrinth.project")
 
+# Value -> member maps, cheaper than calling the enum and tolerant of missing fields
+_SIDE = {m.value: m for m in SideType}
+_PROJECT_STATUS = {m.value: m for m in ProjectStatus}
+_REQUESTED_STATUS = {m.value: m for m in RequestedStatus}
+# Member -> plain string for to_dict. Members of different enums with the same value share a key
+_ENUM_STR = {m: str(m) for enum in (SideType, ProjectStatus, RequestedStatus) for m in enum}
+
 all = [
     "Project",
     "Projects",
@@ -46,6 +52,7 @@ all = [
     "License"
 ]
 
+@dataclass(slots=True, eq=False)
 class License:
     """
     Represents a project license.
@@ -56,10 +63,17 @@ class License:
         url (Optional[str]): URL to license text
     """
 
-    def __init__(self, data: Dict[str, Any]):
-        self.id: str = validate_input(data.get("id"), "id", required=True)
-        self.name: str = validate_input(data.get("name"), "name", required=True)
-        self.url: Optional[str] = validate_input(data.get("url"), "url", required=False)
+    id: str
+    name: str
+    url: Optional[str] = None
+
+    _REQUIRED = frozenset({"id", "name"})
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "License":
+        """Build a license from its API representation."""
+        validate_required(data, cls._REQUIRED)
+        return cls(id=data["id"], name=data["name"], url=data.get("url"))
 
     def __repr__(self) -> str:
         return f"<License id='{self.id}' name='{self.name}'>"
@@ -77,6 +91,7 @@ class License:
             "url": self.url,
         }
 
+@dataclass(slots=True, eq=False)
 class GalleryItem:
     """
     Represents a project gallery item.
@@ -90,15 +105,35 @@ class GalleryItem:
         ordering (int): Display order
     """
 
-    def __init__(self, data: Dict[str, Any]):
-        self.url: str = validate_input(data.get("url"), "url", required=True)
-        self.featured: bool = validate_input(data.get("featured"), "featured", required=True)
-        self.ordering: int = validate_input(data.get("ordering"), "ordering", required=True)
-        self.created: datetime = datetime.fromisoformat(
-            validate_input(data.get("created"), "created", required=True)
+    url: str
+    featured: bool
+    ordering: int
+    _created_raw: str
+    title: Optional[str] = None
+    description: Optional[str] = None
+    _created: Optional[datetime] = field(default=None, init=False, repr=False)
+
+    _REQUIRED = frozenset({"url", "featured", "ordering", "created"})
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "GalleryItem":
+        """Build a gallery item from its API representation."""
+        validate_required(data, cls._REQUIRED)
+        return cls(
+            url=data["url"],
+            featured=data["featured"],
+            ordering=data["ordering"],
+            _created_raw=data["created"],
+            title=data.get("title"),
+            description=data.get("description"),
         )
-        self.title: Optional[str] = validate_input(data.get("title"), "title", required=False)
-        self.description: Optional[str] = validate_input(data.get("description"), "description", required=False)
+
+    @property
+    def created(self) -> datetime:
+        """When the image was added, parsed on first access."""
+        if self._created is None:
+            self._created = _parse_iso(self._created_raw)
+        return self._created
 
     def __repr__(self) -> str:
         return f"<GalleryItem url='{self.url}' featured={self.featured}>"
@@ -114,11 +149,12 @@ class GalleryItem:
             "url": self.url,
             "featured": self.featured,
             "ordering": self.ordering,
-            "created": self.created.isoformat(),
+            "created": self._created_raw,
             "title": self.title,
             "description": self.description,
         }
 
+@dataclass(slots=True, eq=False)
 class Project:
     """
     Represents a Modrinth project.
@@ -131,7 +167,7 @@ class Project:
         downloads (int): Total download count
         followers (int): Number of followers
         license (License): Project license
-        versions (List[str]): List of version IDs
+        versions (Sequence[str]): Version IDs
         
     Example:
         >>> project = await client.get_project("fabric-api")
@@ -140,61 +176,102 @@ class Project:
         >>> print(f"Latest version: {latest.version_number}")
     """
 
-    def __init__(self, data: Dict[str, Any]):
-        self.id: str = validate_input(data.get("id"), "id", required=True)
-        self.project_type: str = validate_input(data.get("project_type"), "project_type", required=True)
-        self.downloads: int = validate_input(data.get("downloads"), "downloads", required=True)
-        self.team: str = validate_input(data.get("team"), "team", required=True)
-        self.published: datetime = datetime.fromisoformat(
-            validate_input(data.get("published"), "published", required=True)
-        )
-        self.updated: datetime = datetime.fromisoformat(
-            validate_input(data.get("updated"), "updated", required=True)
-        )
-        self.followers: int = validate_input(data.get("followers"), "followers", required=True)
-        self.license: Optional[License] = (
-            License(data["license"]) if data.get("license") else None
-        )
+    id: str
+    project_type: str
+    downloads: int
+    team: str
+    _published_raw: str
+    _updated_raw: str
+    followers: int
+    license: Optional[License] = None
 
-        # Optional fields with defaults
-        self.slug: str = validate_input(data.get("slug", ""), "slug", required=False) or ""
-        self.title: Optional[str] = validate_input(data.get("title"), "title", required=False)
-        self.description: Optional[str] = validate_input(data.get("description"), "description", required=False)
-        self.categories: List[str] = validate_input(data.get("categories", []), "categories", required=False) or []
-        self.client_side: Optional[SideType] = SideType(
-            validate_input(data.get("client_side"), "client_side", required=False)
-        )
-        self.server_side: Optional[SideType] = SideType(
-            validate_input(data.get("server_side"), "server_side", required=False)
-        )
-        self.body: Optional[str] = validate_input(data.get("body"), "body", required=False)
-        self.status: Optional[ProjectStatus] = ProjectStatus(
-            validate_input(data.get("status"), "status", required=False)
+    # Optional fields with defaults. List fields keep the API's list, or share
+    # an empty tuple when the field is absent
+    slug: str = ""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    categories: Sequence[str] = ()
+    client_side: Optional[SideType] = None
+    server_side: Optional[SideType] = None
+    body: Optional[str] = None
+    status: Optional[ProjectStatus] = None
+    requested_status: Optional[RequestedStatus] = None
+    additional_categories: Sequence[str] = ()
+    issues_url: Optional[str] = None
+    source_url: Optional[str] = None
+    wiki_url: Optional[str] = None
+    discord_url: Optional[str] = None
+    donation_urls: Sequence[Dict[str, Any]] = ()
+    icon_url: Optional[str] = None
+    color: Optional[int] = None
+    versions: Sequence[str] = ()
+    game_versions: Sequence[str] = ()
+    loaders: Sequence[str] = ()
+    gallery: List[GalleryItem] = field(default_factory=list)
+
+    # HTTP client for making API requests
+    _http: Optional[HTTPClient] = field(default=None, repr=False)
+
+    # Parsed from the raw ISO strings on first access
+    _published: Optional[datetime] = field(default=None, init=False, repr=False)
+    _updated: Optional[datetime] = field(default=None, init=False, repr=False)
+    # Built by the first to_dict call; projects are not modified after construction
+    _serialized: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    _REQUIRED = frozenset({
+        "id", "project_type", "downloads", "team", "published", "updated", "followers"
+    })
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any], http: Optional[HTTPClient] = None) -> "Project":
+        """
+        Build a project from its API representation.
+        
+        Args:
+            data (Dict[str, Any]): Raw project data
+            http (HTTPClient, optional): HTTP client used by the project's version helpers
+            
+        Returns:
+            Project: The parsed project
+            
+        Raises:
+            ValidationError: If a required field is missing
+        """
+        validate_required(data, cls._REQUIRED)
+        g = data.get
+        license = g("license")
+        return cls(
+            id=data["id"],
+            project_type=data["project_type"],
+            downloads=data["downloads"],
+            team=data["team"],
+            _published_raw=data["published"],
+            _updated_raw=data["updated"],
+            followers=data["followers"],
+            license=License.from_api(license) if license else None,
+            slug=g("slug") or "",
+            title=g("title"),
+            description=g("description"),
+            categories=g("categories") or (),
+            client_side=_SIDE.get(g("client_side")),
+            server_side=_SIDE.get(g("server_side")),
+            body=g("body"),
+            status=_PROJECT_STATUS.get(g("status")),
+            requested_status=_REQUESTED_STATUS.get(g("requested_status")),
+            additional_categories=g("additional_categories") or (),
+            issues_url=g("issues_url"),
+            source_url=g("source_url"),
+            wiki_url=g("wiki_url"),
+            discord_url=g("discord_url"),
+            donation_urls=g("donation_urls") or (),
+            icon_url=g("icon_url"),
+            color=g("color"),
+            versions=g("versions") or (),
+            game_versions=g("game_versions") or (),
+            loaders=g("loaders") or (),
+            gallery=[GalleryItem.from_api(item) for item in g("gallery") or ()],
+            _http=http,
         )
-        self.requested_status: Optional[RequestedStatus]
-        if data.get("requested_status"):
-             self.requested_status = RequestedStatus(
-                validate_input(data.get("requested_status"), "requested_status", required=False)
-            )
-        else:
-            self.requested_status = None
-        self.additional_categories: List[str] = validate_input(data.get("additional_categories", []), "additional_categories", required=False) or []
-        self.issues_url: Optional[str] = validate_input(data.get("issues_url"), "issues_url", required=False)
-        self.source_url: Optional[str] = validate_input(data.get("source_url"), "source_url", required=False)
-        self.wiki_url: Optional[str] = validate_input(data.get("wiki_url"), "wiki_url", required=False)
-        self.discord_url: Optional[str] = validate_input(data.get("discord_url"), "discord_url", required=False)
-        self.donation_urls: List[Dict[str, Any]] = validate_input(data.get("donation_urls", []), "donation_urls", required=False) or []
-        self.icon_url: Optional[str] = validate_input(data.get("icon_url"), "icon_url", required=False)
-        self.color: Optional[int] = validate_input(data.get("color"), "color", required=False)
-        self.versions: List[str] = validate_input(data.get("versions", []), "versions", required=False) or []
-        self.game_versions: List[str] = validate_input(data.get("game_versions", []), "game_versions", required=False) or []
-        self.loaders: List[str] = validate_input(data.get("loaders", []), "loaders", required=False) or []
-        self.gallery: List[GalleryItem] = [
-            GalleryItem(item) for item in data.get("gallery", [])
-        ]
-
-        # HTTP client for making API requests
-        self._http: Optional[HTTPClient] = None
         
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -203,6 +280,12 @@ class Project:
         Returns:
             Dict[str, Any]: Dictionary representation of the project
         """
+        if self._serialized is None:
+            self._serialized = self._build_dict()
+        return dict(self._serialized)
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary returned by to_dict."""
         return {
             "id": self.id,
             "slug": self.slug,
@@ -213,11 +296,11 @@ class Project:
             "license": self.license.to_dict() if self.license else None,
             "versions": self.versions,
             "categories": self.categories,
-            "client_side": str(self.client_side) if self.client_side else None,
-            "server_side": str(self.server_side) if self.server_side else None,
+            "client_side": _ENUM_STR.get(self.client_side),
+            "server_side": _ENUM_STR.get(self.server_side),
             "body": self.body,
-            "status": str(self.status) if self.status else None,
-            "requested_status": str(self.requested_status) if self.requested_status else None,
+            "status": _ENUM_STR.get(self.status),
+            "requested_status": _ENUM_STR.get(self.requested_status),
             "additional_categories": self.additional_categories,
             "issues_url": self.issues_url,
             "source_url": self.source_url,
@@ -231,13 +314,23 @@ class Project:
             "gallery": [item.to_dict() for item in self.gallery],
         }
 
+    @property
+    def published(self) -> datetime:
+        """When the project was published, parsed on first access."""
+        if self._published is None:
+            self._published = _parse_iso(self._published_raw)
+        return self._published
+
+    @property
+    def updated(self) -> datetime:
+        """When the project was last updated, parsed on first access."""
+        if self._updated is None:
+            self._updated = _parse_iso(self._updated_raw)
+        return self._updated
+
     def __repr__(self) -> str:
         return f"<Project id='{self.id}' title='{self.title}'>"
 
-    def _init_http(self, http: HTTPClient) -> None:
-        """Initialize HTTP client for API requests."""
-        self._http = http
-    
     async def get_version(self, id) -> Version:
         """
         Get the latest version of the project.
@@ -249,13 +342,13 @@ class Project:
             NotFoundError: If no versions are found
         """
         if not self.versions:
-            logger.warning(f"No versions found for project {self.id}")
+            logger.warning("No versions found for project %s", self.id)
             raise NotFoundError("No versions found for this project")
         if self._http is None:
-            logger.error(f"HTTP client not initialized for project {self.id}")
+            logger.error("HTTP client not initialized for project %s", self.id)
             raise ValueError("HTTP client is not initialized.")
         
-        logger.info(f"Fetching version {id} for project {self.id}")
+        logger.info("Fetching version %s for project %s", id, self.id)
         return await Versions(self._http).get_version(id)
         
 
@@ -269,7 +362,7 @@ class Project:
         Raises:
             NotFoundError: If no versions are found
         """
-        logger.info(f"Fetching latest version for project {self.id}")
+        logger.info("Fetching latest version for project %s", self.id)
         return await self.get_version(self.latest_version)
     
     @property
@@ -284,9 +377,10 @@ class Project:
             NotFoundError: If no versions are found
         """
         if not self.versions:
-            logger.warning(f"No versions found for project {self.id}")
+            logger.warning("No versions found for project %s", self.id)
             raise NotFoundError("No versions found for this project")
-        logger.debug(f"Latest version for project {self.id} is {self.versions[0]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Latest version for project %s is %s", self.id, self.versions[0])
         return self.versions[0]  # First version in the list is the latest
 
 class SearchResult:
@@ -300,38 +394,34 @@ class SearchResult:
             data: Raw search result data
             http: HTTP client for API requests
         """
-        hits = data.get("hits", [])
-        self.hits: List[Project] = []
-        
-        for hit in hits:
-            project = Project(hit)
-            project._init_http(http)
-            self.hits.append(project)
-            
+        self.hits: List[Project] = [Project.from_api(hit, http) for hit in data.get("hits", [])]
         self.total_hits: int = data.get("total_hits", 0)
         self.offset: int = data.get("offset", 0)
         self.limit: int = data.get("limit", 0)
+        # Filled by Projects.search_projects(prefetch_versions=True)
+        self._versions: Optional[VersionList] = None
     
-    async def get_versions(self) -> List[Version]:
+    async def get_versions(self) -> VersionList:
         """
         Get all the latest versions for the projects in the search results.
         
         Returns:
-            List[Version]: List of all versions for the projects
+            VersionList: Latest version of each project, built lazily on access
             
         Raises:
             NotFoundError: If no versions are found
         """
-        if not self.hits:
-            raise NotFoundError("No projects found in search results")
-        
+        if self._versions is not None:
+            return self._versions
+
         if not self.hits:
             raise NotFoundError("No projects found in search results")
         if not self.hits[0]._http:
             raise ValueError("HTTP client is not initialized.")
         
         versions = Versions(self.hits[0]._http)
-        versionsCodes = [project.latest_version for project in self.hits]
+        # Projects without any versions are skipped rather than failing the whole lookup
+        versionsCodes = [project.versions[0] for project in self.hits if project.versions]
         if not versionsCodes:
             raise NotFoundError("No versions found for this project")
         return await versions.get_versions(versionsCodes)
@@ -397,9 +487,7 @@ class Projects:
             ValidationError: If project_id is invalid
         """
         data = await self.http._get_project(project_id)
-        project = Project(data)
-        project._init_http(self.http)
-        return project
+        return Project.from_api(data, self.http)
     
     async def get_projects(self, project_ids: List[str]) -> List[Project]:
         """
@@ -412,12 +500,7 @@ class Projects:
             List[Project]: List of requested projects
         """
         data = await self.http._get_projects(project_ids)
-        projects = []
-        for project_data in data:
-            project = Project(project_data)
-            project._init_http(self.http)
-            projects.append(project)
-        return projects
+        return [Project.from_api(project_data, self.http) for project_data in data]
 
     async def search_projects(
         self,
@@ -429,6 +512,7 @@ class Projects:
         project_type: ProjectType = MISSING,
         categories: List[str] = MISSING,
         open_source: bool = MISSING,
+        prefetch_versions: bool = False,
     ) -> SearchResult:
         """
         Search for projects with optional filters.
@@ -442,6 +526,8 @@ class Projects:
             project_type (str, optional): Filter by project types
             categories (List[str], optional): Filter by categories
             open_source (bool): Filter by open source projects (default: False)
+            prefetch_versions (bool): Fetch the latest version of every hit alongside the
+                project details, so SearchResult.get_versions() needs no further request
             
         Returns:
             SearchResult: Container with search results
@@ -470,5 +556,15 @@ class Projects:
         if not isinstance(hits, list):
             raise TypeError(f"Expected 'hits' to be a list, got {type(hits).__name__}")
         ids: List[str] = [str(project["project_id"]) for project in hits]
-        data["hits"] = await self.http._get_projects(ids)
-        return SearchResult(data, self.http)
+        version_ids = [hit["latest_version"] for hit in hits if hit.get("latest_version")]
+        if prefetch_versions and version_ids:
+            # Both lookups only need the search hits, so run them side by side
+            data["hits"], prefetched = await asyncio.gather(
+                self.http._get_projects(ids),
+                Versions(self.http).get_versions(version_ids),
+            )
+        else:
+            data["hits"], prefetched = await self.http._get_projects(ids), None
+        result = SearchResult(data, self.http)
+        result._versions = prefetched
+        return result
@@ -11,20 +11,25 @@ Example:
     ...         print(f"{tag.name} - {tag.project_type}")
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
 import logging
 from .http import HTTPClient
 from .utils import (
     MISSING, 
     VersionType, 
-    validate_input,
+    validate_required,
+    _parse_iso,
+    ModrinthException,
     ValidationError,
     NotFoundError
 )
 
 logger = logging.getLogger("modrinth.tags")
 
+_VERSION_TYPE = {m.value: m for m in VersionType}
+
 all = [
     "CategoryTag",
     "LoaderTag",
@@ -43,11 +48,14 @@ class CategoryTag:
         header (str): Header text for the category
     """
 
+    _REQUIRED = frozenset({"icon", "name", "project_type", "header"})
+
     def __init__(self, data: Dict[str, Any]):
-        self.icon: str = validate_input(data.get("icon"), "icon", required=True)
-        self.name: str = validate_input(data.get("name"), "name", required=True)
-        self.project_type: str = validate_input(data.get("project_type"), "project_type", required=True)
-        self.header: str = validate_input(data.get("header"), "header", required=True)
+        validate_required(data, self._REQUIRED)
+        self.icon: str = data["icon"]
+        self.name: str = data["name"]
+        self.project_type: str = data["project_type"]
+        self.header: str = data["header"]
     
     def __repr__(self) -> str:
         return f"<CategoryTag name='{self.name}' type='{self.project_type}'>"
@@ -62,14 +70,13 @@ class LoaderTag:
         supported_project_types (List[str]): Project types this loader supports
     """
 
+    _REQUIRED = frozenset({"icon", "name"})
+
     def __init__(self, data: Dict[str, Any]):
-        self.icon: str = validate_input(data.get("icon"), "icon", required=True)
-        self.name: str = validate_input(data.get("name"), "name", required=True)
-        self.supported_project_types: List[str] = validate_input(
-            data.get("supported_project_types", []), 
-            "supported_project_types",
-            required=True
-        )
+        validate_required(data, self._REQUIRED)
+        self.icon: str = data["icon"]
+        self.name: str = data["name"]
+        self.supported_project_types: List[str] = data.get("supported_project_types") or []
     
     def __repr__(self) -> str:
         return f"<LoaderTag name='{self.name}'>"
@@ -85,20 +92,26 @@ class GameVersionTag:
         major (bool): Whether this is a major version
     """
 
+    _REQUIRED = frozenset({"version", "version_type", "date"})
+
     def __init__(self, data: Dict[str, Any]):
-        self.version: str = validate_input(data.get("version"), "version", required=True)
-        self.version_type: VersionType = VersionType(
-            validate_input(data.get("version_type"), "version_type", required=True)
-        )
+        validate_required(data, self._REQUIRED)
+        self.version: str = data["version"]
+        version_type = _VERSION_TYPE.get(data.get("version_type"))
+        if version_type is None:
+            raise ValidationError(f"Invalid version_type: {data.get('version_type')}")
+        self.version_type: VersionType = version_type
+        self._date_raw: str = data["date"]
+        self.major: bool = data.get("major", False)
+    
+    @cached_property
+    def date(self) -> datetime:
+        """Release date of the version, parsed on first access."""
         try:
-            self.date: datetime = datetime.fromisoformat(
-                validate_input(data.get("date"), "date", required=True)
-            )
+            return _parse_iso(self._date_raw)
         except ValueError as e:
             raise ValidationError(f"Invalid date format: {e}")
-        
-        self.major: bool = validate_input(data.get("major", False), "major", required=False)
-    
+
     def __repr__(self) -> str:
         return f"<GameVersionTag version='{self.version}' type='{self.version_type.value}'>"
 
@@ -139,9 +152,9 @@ class Tags:
         try:
             tags = await self.http_session._get_categories_tags()
             return [CategoryTag(tag) for tag in tags]
-        except Exception as e:
-            logger.error(f"Failed to fetch category tags: {str(e)}", exc_info=True)
-            raise NotFoundError(f"Failed to fetch category tags: {str(e)}")
+        except ModrinthException as e:
+            logger.error("Failed to fetch category tags: %s", e)
+            raise
     
     async def get_loader_tags(self) -> List[LoaderTag]:
         """
@@ -158,9 +171,9 @@ class Tags:
         try:
             tags = await self.http_session._get_loader_tags()
             return [LoaderTag(tag) for tag in tags]
-        except Exception as e:
-            logger.error(f"Failed to fetch loader tags: {str(e)}", exc_info=True)
-            raise NotFoundError(f"Failed to fetch loader tags: {str(e)}")
+        except ModrinthException as e:
+            logger.error("Failed to fetch loader tags: %s", e)
+            raise
     
     async def get_game_version_tags(self) -> List[GameVersionTag]:
         """
@@ -177,6 +190,39 @@ class Tags:
         try:
             tags = await self.http_session._get_game_versions()
             return [GameVersionTag(tag) for tag in tags]
-        except Exception as e:
-            logger.error(f"Failed to fetch game version tags: {str(e)}", exc_info=True)
-            raise NotFoundError(f"Failed to fetch game version tags: {str(e)}")
\ No newline at end of file
+        except ModrinthException as e:
+            logger.error("Failed to fetch game version tags: %s", e)
+            raise
+
+    async def get_all(self) -> Tuple[List[CategoryTag], List[LoaderTag], List[GameVersionTag]]:
+        """
+        Fetch category, loader and game version tags concurrently.
+        
+        Returns:
+            Tuple[List[CategoryTag], List[LoaderTag], List[GameVersionTag]]:
+                Category, loader and game version tags
+            
+        Raises:
+            ModrinthException: If any of the tag endpoints fails
+        """
+        logger.info("Fetching all tags")
+        try:
+            categories, loaders, game_versions = await self.http_session._request_many([
+                ("GET", "tag/category", {}),
+                ("GET", "tag/loader", {}),
+                ("GET", "tag/game_version", {}),
+            ])
+            if not (
+                isinstance(categories, list)
+                and isinstance(loaders, list)
+                and isinstance(game_versions, list)
+            ):
+                raise ModrinthException("Expected a list response for tags")
+            return (
+                [CategoryTag(tag) for tag in categories],
+                [LoaderTag(tag) for tag in loaders],
+                [GameVersionTag(tag) for tag in game_versions],
+            )
+        except ModrinthException as e:
+            logger.error("Failed to fetch tags: %s", e)
+            raise
@@ -3,12 +3,16 @@ Utility module for the Modrinth API wrapper.
 Contains helper classes, enums, and functions for working with the Modrinth API.
 """
 
-from json import dumps
 from typing import Any, Optional, Union, TypeVar, Dict, overload
 import logging
 from enum import StrEnum
 from datetime import datetime
-from urllib.parse import quote
+from functools import lru_cache
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # fromisoformat accepts the "Z" suffix from Python 3.11 on
+    _parse_datetime = datetime.fromisoformat
 
 T = TypeVar('T')
 
@@ -19,8 +23,9 @@ OptionalT = TypeVar('OptionalT')
 RequiredT = TypeVar('RequiredT')
 all = [
     "format_datetime",
+    "_parse_iso",
     "validate_input",
-    "list_to_query_param",
+    "validate_required",
     "MISSING",
     "ModrinthException",
     "RateLimitError",
@@ -45,7 +50,9 @@ class ModrinthException(Exception):
 
 class RateLimitError(ModrinthException):
     """Raised when the API rate limit is exceeded."""
-    pass
+    def __init__(self, message: str, retry_after: int = 60):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class AuthenticationError(ModrinthException):
     """Raised when authentication fails."""
@@ -78,6 +85,11 @@ class _MissingSentinel:
 
 MISSING: Any = _MissingSentinel()
 
+@lru_cache(maxsize=4096)
+def _parse_iso(date: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized since API payloads repeat them a lot."""
+    return _parse_datetime(date)
+
 def format_datetime(date: Optional[str]) -> Optional[datetime]:
     """
     Convert an ISO 8601 formatted date string to a datetime object.
@@ -94,7 +106,7 @@ def format_datetime(date: Optional[str]) -> Optional[datetime]:
         >>> format_datetime(None)
         None
     """
-    return datetime.fromisoformat(date.replace('Z', '+00:00')) if date else None
+    return _parse_iso(date) if date else None
 
 @overload
 def validate_input(value: Any, field_name: str, *, required: bool = True) -> RequiredT: # type: ignore
@@ -125,27 +137,22 @@ def validate_input(value: Any, field_name: str, *, required: bool = True) -> Any
         return value
     return value if value is not MISSING else None
 
-def list_to_query_param(values: list[str], param) -> str:
+def validate_required(data: Dict[str, Any], required: frozenset) -> None:
     """
-    Convert a list of values into a URL query parameter string.
+    Check that all required fields of an API object are present in one pass.
     
-    :param: values (list[str]): The list of values to convert.
-    :param: param (str): The parameter name to use in the query string.
-
-    Returns:
-        str: A URL query parameter string.
-
-    Example:
-        >>> list_to_query_param(["mod", "plugin"])
-        "[mod&plugin]"
+    Args:
+        data (Dict[str, Any]): The raw API object
+        required (frozenset): Names of the fields that must be present and not None
+        
+    Raises:
+        ValidationError: If any required field is missing
     """
-    # %22 is the URL-encoded representation of a double quote (")
-    # %2C is the URL-encoded representation of a comma (,)
-    # + is the URL-encoded representation of a space
-    
-    json_array = dumps(values)
-    logger.debug(json_array)
-    return f"{param}={quote(json_array)}"
+    missing = required - data.keys()
+    if not missing:
+        missing = {key for key in required if data[key] is None}
+    if missing:
+        raise ValidationError(f"{', '.join(sorted(missing))} is required")
 
 class ProjectType(StrEnum):
     """Enum for Modrinth project types."""
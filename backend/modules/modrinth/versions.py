@@ -11,10 +11,15 @@ Example:
     ...     print(f"Version: {version.name} ({version.version_number})")
 """
 
+from collections.abc import Sequence
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterator, Optional, Union, overload
 from datetime import datetime
+import asyncio
 import logging
+import os
+import aiofiles
+import aiohttp
 from .http import HTTPClient
 from .utils import (
     MISSING,
@@ -25,16 +30,58 @@ from .utils import (
     ValidationError,
     NotFoundError,
     format_datetime,
+    _parse_iso,
 )
 all = [
     "File",
     "Dependency",
     "Version",
+    "VersionList",
     "Versions",
 ]
 
 logger = logging.getLogger("modrinth.versions")
 
+# (attribute, required) for the fields copied straight from the API object
+_FILE_FIELDS = (
+    ("url", True),
+    ("filename", True),
+    ("primary", True),
+    ("size", True),
+    ("file_type", False),
+)
+_DEPENDENCY_FIELDS = (
+    ("version_id", False),
+    ("project_id", False),
+    ("file_name", False),
+    ("dependency_type", True),
+)
+_VERSION_FIELDS = (
+    ("id", True),
+    ("name", True),
+    ("version_number", True),
+    ("changelog", False),
+    ("version_type", True),
+    ("featured", True),
+    ("status", True),
+    ("requested_status", False),
+    ("project_id", True),
+    ("author_id", True),
+    ("date_published", True),
+    ("downloads", True),
+    ("changelog_url", False),
+)
+
+
+def _assign_fields(obj: Any, data: Dict[str, Any], fields: tuple) -> None:
+    """Copy fields from an API object onto obj, raising if a required one is missing."""
+    get = data.get
+    for attr, required in fields:
+        value = get(attr)
+        if value is None and required:
+            raise ValidationError(f"{attr} is required")
+        setattr(obj, attr, value)
+
 
 class File:
     """
@@ -49,50 +96,62 @@ class File:
         file_type (Optional[str]): Type of the file
     """
 
+    __slots__ = ("hashes", "url", "filename", "primary", "size", "file_type")
+
     def __init__(self, data: Dict[str, Any]):
+        _assign_fields(self, data, _FILE_FIELDS)
         self.hashes: Dict[str, str] = validate_input(
             data.get("hashes", {}), "hashes", required=True
         )
-        self.url: str = validate_input(data.get("url"), "url", required=True)
-        self.filename: str = validate_input(
-            data.get("filename"), "filename", required=True
-        )
-        self.primary: bool = validate_input(
-            data.get("primary"), "primary", required=True
-        )
-        self.size: int = validate_input(data.get("size"), "size", required=True)
-        self.file_type: Optional[str] = validate_input(
-            data.get("file_type"), "file_type", required=False
-        )
 
-    async def download(self, path: str | Path, chunk_size: int = 8192) -> str:
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "File":
+        """Build a File from an API response without re-validating the schema."""
+        file = cls.__new__(cls)
+        file.url = data["url"]
+        file.filename = data["filename"]
+        file.primary = data["primary"]
+        file.size = data["size"]
+        file.file_type = data.get("file_type")
+        file.hashes = data.get("hashes") or {}
+        return file
+
+    async def download(
+        self,
+        path: str | Path,
+        chunk_size: int = 1 << 20,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> str:
         """
         Download the file to the specified path.
 
         Args:
             path (str): Directory to save the file in
             chunk_size (int): Size of chunks to download
+            session (aiohttp.ClientSession, optional): Session to reuse, so several
+                downloads share connections. A temporary one is created if omitted
 
         Returns:
             str: Path to the downloaded file
         """
-        import os
-        import aiohttp
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.download(path, chunk_size, own_session)
 
-        logger.info(f"Downloading file {self.filename} to {path}")
+        logger.info("Downloading file %s to %s", self.filename, path)
 
         os.makedirs(path, exist_ok=True)
         filepath = os.path.join(path, self.filename)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.url) as response:
-                response.raise_for_status()
+        async with session.get(self.url) as response:
+            response.raise_for_status()
 
-                with open(filepath, "wb") as f:
-                    async for chunk in response.content.iter_chunked(chunk_size):
-                        f.write(chunk)
+            # Write off the event loop so concurrent downloads don't stall on disk I/O
+            async with aiofiles.open(filepath, "wb") as f:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    await f.write(chunk)
 
-        logger.debug(f"File downloaded successfully to {filepath}")
+        logger.debug("File downloaded successfully to %s", filepath)
         return filepath
 
     def __repr__(self) -> str:
@@ -110,21 +169,21 @@ class Dependency:
         dependency_type (DependencyType): Type of dependency (required, optional, etc.)
     """
 
+    __slots__ = ("version_id", "project_id", "file_name", "dependency_type")
+
     def __init__(self, data: Dict[str, Any]):
-        self.version_id: str = validate_input(
-            data.get("version_id"), "version_id", required=False
-        )
-        self.project_id: str = validate_input(
-            data.get("project_id"), "project_id", required=False
-        )
-        self.file_name: Optional[str] = validate_input(
-            data.get("file_name"), "file_name", required=False
-        )
-        self.dependency_type: DependencyType = DependencyType(
-            validate_input(
-                data.get("dependency_type"), "dependency_type", required=True
-            )
-        )
+        _assign_fields(self, data, _DEPENDENCY_FIELDS)
+        self.dependency_type: DependencyType = DependencyType(self.dependency_type)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Dependency":
+        """Build a Dependency from an API response without re-validating the schema."""
+        dependency = cls.__new__(cls)
+        dependency.version_id = data.get("version_id")
+        dependency.project_id = data.get("project_id")
+        dependency.file_name = data.get("file_name")
+        dependency.dependency_type = DependencyType(data["dependency_type"])
+        return dependency
 
     def __repr__(self) -> str:
         return f"<Dependency project='{self.project_id}' version='{self.version_id}'>"
@@ -152,55 +211,58 @@ class Version:
         files (List[File]): Downloadable files
     """
 
+    __slots__ = (
+        "id", "name", "version_number", "changelog", "dependencies", "game_versions",
+        "version_type", "loaders", "featured", "status", "requested_status", "project_id",
+        "author_id", "date_published", "downloads", "changelog_url", "files",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.id: str = validate_input(data.get("id"), "id", required=True)
-        self.name: str = validate_input(data.get("name"), "name", required=True)
-        self.version_number: str = validate_input(
-            data.get("version_number"), "version_number", required=True
-        )
-        self.changelog: Optional[str] = validate_input(
-            data.get("changelog"), "changelog", required=False
-        )
-        self.dependencies: List[Dependency] = [
-            Dependency(dep) for dep in data.get("dependencies", [])
-        ]
+        _assign_fields(self, data, _VERSION_FIELDS)
+        self.version_type: VersionType = VersionType(self.version_type)
+        self.status: VersionStatus = VersionStatus(self.status)
+        self.date_published: datetime = _parse_iso(self.date_published)
         self.game_versions: List[str] = validate_input(
             data.get("game_versions", []), "game_versions", required=True
         )
-        self.version_type: VersionType = VersionType(
-            validate_input(data.get("version_type"), "version_type", required=True)
-        )
         self.loaders: List[str] = validate_input(
             data.get("loaders", []), "loaders", required=True
         )
-        self.featured: bool = validate_input(
-            data.get("featured"), "featured", required=True
-        )
-        self.status: VersionStatus = VersionStatus(
-            validate_input(data.get("status"), "status", required=True)
-        )
-        self.requested_status: Optional[str] = validate_input(
-            data.get("requested_status"), "requested_status", required=False
-        )
-        self.project_id: str = validate_input(
-            data.get("project_id"), "project_id", required=True
-        )
-        self.author_id: str = validate_input(
-            data.get("author_id"), "author_id", required=True
-        )
-        self.date_published: datetime = datetime.fromisoformat(
-            validate_input(data.get("date_published"), "date_published", required=True)
-        )
-        self.downloads: int = validate_input(
-            data.get("downloads"), "downloads", required=True
-        )
-        self.changelog_url: Optional[str] = validate_input(
-            data.get("changelog_url"), "changelog_url", required=False
-        )
+        self.dependencies: List[Dependency] = [
+            Dependency(dep) for dep in data.get("dependencies", [])
+        ]
         self.files: List[File] = [
             File(file_data) for file_data in data.get("files", [])
         ]
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Version":
+        """
+        Build a Version from a Modrinth API response without re-validating the schema.
+
+        Use Version(data) for objects that did not come straight from the API.
+        """
+        get = data.get
+        version = cls.__new__(cls)
+        version.id = data["id"]
+        version.name = data["name"]
+        version.version_number = data["version_number"]
+        version.changelog = get("changelog")
+        version.version_type = VersionType(data["version_type"])
+        version.featured = data["featured"]
+        version.status = VersionStatus(data["status"])
+        version.requested_status = get("requested_status")
+        version.project_id = data["project_id"]
+        version.author_id = data["author_id"]
+        version.date_published = _parse_iso(data["date_published"])
+        version.downloads = data["downloads"]
+        version.changelog_url = get("changelog_url")
+        version.game_versions = get("game_versions") or []
+        version.loaders = get("loaders") or []
+        version.dependencies = [Dependency.from_trusted(dep) for dep in get("dependencies") or ()]
+        version.files = [File.from_trusted(file_data) for file_data in get("files") or ()]
+        return version
+
     def __repr__(self) -> str:
         return f"<Version id='{self.id}' name='{self.name}' version='{self.version_number}'>"
 
@@ -224,6 +286,45 @@ class Version:
         return None
 
 
+class VersionList(Sequence):
+    """
+    Read-only list of versions that builds each Version the first time it is accessed.
+
+    Callers that only look at the first entry, or just need len(), skip constructing
+    the rest of a large response.
+    """
+
+    __slots__ = ("_data", "_items")
+
+    def __init__(self, data: List[Dict[str, Any]]):
+        self._data = data
+        self._items: List[Optional[Version]] = [None] * len(data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> Version: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Version]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._data)))]
+        version = self._items[index]
+        if version is None:
+            version = self._items[index] = Version.from_trusted(self._data[index])
+        return version
+
+    def __iter__(self) -> Iterator[Version]:
+        for i in range(len(self._data)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"<VersionList size={len(self._data)}>"
+
+
 class Versions:
     """
     Manages version-related operations for the Modrinth API.
@@ -246,7 +347,7 @@ class Versions:
         """
         self.http_session = http_client
     
-    async def get_versions(self, version_ids: List[str]) -> List[Version]:
+    async def get_versions(self, version_ids: List[str]) -> VersionList:
         """
         Fetch all versions for a given project.
 
@@ -254,18 +355,18 @@ class Versions:
             project_id (str): ID of the project
 
         Returns:
-            List[Version]: List of versions for the project
+            VersionList: Versions for the project, built lazily on access
 
         Raises:
             NotFoundError: If the project is not found
             ValidationError: If the API returns invalid data
         """
-        logger.info(f"Fetching versions: {version_ids}")
+        logger.info("Fetching versions: %s", version_ids)
         try:
             versions_data = await self.http_session._get_versions(version_ids)
-            return [Version(data) for data in versions_data]
+            return VersionList(versions_data)
         except Exception as e:
-            logger.error(f"Failed to fetch versions: {str(e)}", exc_info=True)
+            logger.error("Failed to fetch versions: %s", e, exc_info=True)
             raise NotFoundError(f"Failed to fetch versions: {str(e)}")
     
     async def get_version(self, version_id: str) -> Version:
@@ -282,10 +383,33 @@ class Versions:
             NotFoundError: If the project or version is not found
             ValidationError: If the API returns invalid data
         """
-        logger.info(f"Fetching version: {version_id}")
+        logger.info("Fetching version: %s", version_id)
         try:
             version_data = await self.http_session._get_version(version_id)
-            return Version(version_data)
+            return Version.from_trusted(version_data)
         except Exception as e:
-            logger.error(f"Failed to fetch version: {str(e)}", exc_info=True)
-            raise NotFoundError(f"Failed to fetch version: {str(e)}")
\ No newline at end of file
+            logger.error("Failed to fetch version: %s", e, exc_info=True)
+            raise NotFoundError(f"Failed to fetch version: {str(e)}")
+
+    async def download_all(
+        self, files: List[File], path: str | Path, concurrency: int = 8
+    ) -> List[str]:
+        """
+        Download several files over one shared session.
+
+        Args:
+            files (List[File]): Files to download
+            path (str): Directory to save the files in
+            concurrency (int): Maximum number of downloads running at once
+
+        Returns:
+            List[str]: Paths to the downloaded files, in the order of files
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with aiohttp.ClientSession() as session:
+            async def fetch(file: File) -> str:
+                async with semaphore:
+                    return await file.download(path, session=session)
+
+            return list(await asyncio.gather(*(fetch(file) for file in files)))
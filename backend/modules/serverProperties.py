@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Union, List, Callable
 from rich import print
 import json
+import shutil
 from datetime import datetime
 
 class PropertyValidationError(Exception):
@@ -28,7 +29,19 @@ class Difficulty(StrEnum):
     NORMAL = "normal"
     HARD = "hard"
 
-@dataclass
+def _parse_ver(version: str) -> tuple[int, ...]:
+    """Turn "1.18+" / "1.21.1" into a comparable (major, minor, patch) tuple"""
+    parts = []
+    for part in version.rstrip("+").split(".")[:3]:
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        parts.append(int(digits or 0))
+    return tuple(parts + [0] * (3 - len(parts)))
+
+@dataclass(slots=True)
 class PropertyDefinition:
     type: type
     default: Any
@@ -36,6 +49,17 @@ class PropertyDefinition:
     versions: List[str] = field(default_factory=lambda: ["*"])
     server_types: List[ServerType] = field(default_factory=lambda: [t for t in ServerType])
     description: str = ""
+    # Parsed once from versions so validation only compares tuples
+    _wildcard: bool = field(default=True, init=False, repr=False)
+    _min_versions: tuple = field(default=(), init=False, repr=False)
+    _exact_versions: frozenset = field(default=frozenset(), init=False, repr=False)
+
+    def __post_init__(self):
+        self._wildcard = "*" in self.versions
+        self._min_versions = tuple(_parse_ver(v) for v in self.versions if v.endswith("+"))
+        self._exact_versions = frozenset(
+            _parse_ver(v) for v in self.versions if v != "*" and not v.endswith("+")
+        )
 
 @dataclass
 class Properties:
@@ -45,6 +69,7 @@ class Properties:
     _version: str = "1.21.1"
 
     def __post_init__(self):
+        self._version_tuple = _parse_ver(self._version)
         self._setup_property_definitions()
         
     def _setup_property_definitions(self):
@@ -67,17 +92,14 @@ class Properties:
             ),
             "level-seed": PropertyDefinition(
                 str, "",
-                lambda x: True,
                 description="Seed for world generation"
             ),
             "gamemode": PropertyDefinition(
                 Gamemode, Gamemode.SURVIVAL,
-                lambda x: x in Gamemode,
                 description="Default game mode"
             ),
             "difficulty": PropertyDefinition(
                 Difficulty, Difficulty.EASY,
-                lambda x: x in Difficulty,
                 description="Game difficulty"
             ),
             "level-type": PropertyDefinition(
@@ -103,6 +125,12 @@ class Properties:
                 description="Paper-specific world settings"
             ),
         }
+        # Attribute name (dashed or underscored) -> property key, so lookups skip str.replace
+        self._name_map = {
+            name: key
+            for key in self._definitions
+            for name in (key, key.replace("-", "_"))
+        }
 
     def validate_property(self, key: str, value: Any) -> bool:
         if key not in self._definitions:
@@ -111,17 +139,11 @@ class Properties:
         definition = self._definitions[key]
         
         # Check version compatibility
-        if "*" not in definition.versions:
-            version_match = False
-            for ver in definition.versions:
-                if ver.endswith("+"):
-                    min_ver = ver[:-1]
-                    if self._version >= min_ver:
-                        version_match = True
-                        break
-                elif ver == self._version:
-                    version_match = True
-                    break
+        if not definition._wildcard:
+            current = self._version_tuple
+            version_match = current in definition._exact_versions or any(
+                current >= min_ver for min_ver in definition._min_versions
+            )
             if not version_match:
                 raise PropertyValidationError(f"Property {key} is not supported in version {self._version}")
 
@@ -131,15 +153,16 @@ class Properties:
 
         # Type conversion
         try:
-            if isinstance(value, str):
+            if issubclass(definition.type, StrEnum):
+                # The enum constructor doubles as the membership check
+                value = definition.type(value)
+            elif isinstance(value, str):
                 if definition.type == bool:
                     value = value.lower() == "true"
                 elif definition.type == int:
                     value = int(value)
                 elif definition.type == float:
                     value = float(value)
-                elif issubclass(definition.type, StrEnum):
-                    value = definition.type(value)
         except (ValueError, TypeError) as e:
             raise PropertyValidationError(f"Invalid type for property {key}: {str(e)}")
 
@@ -152,9 +175,15 @@ class Properties:
     def set_server_info(self, server_type: ServerType, version: str):
         self._server_type = server_type
         self._version = version
+        self._version_tuple = _parse_ver(version)
+
+    def _normalize(self, name: str) -> str:
+        return self._name_map.get(name) or name.replace("_", "-")
 
     def __getattr__(self, name: str) -> Any:
-        normalized_name = name.replace("_", "-")
+        if name.startswith("_"):
+            raise AttributeError(name)
+        normalized_name = self._normalize(name)
         if normalized_name in self._values:
             return self._values[normalized_name]
         elif normalized_name in self._definitions:
@@ -166,7 +195,7 @@ class Properties:
             super().__setattr__(name, value)
             return
 
-        normalized_name = name.replace("_", "-")
+        normalized_name = self._normalize(name)
         if self.validate_property(normalized_name, value):
             self._values[normalized_name] = value
 
@@ -188,13 +217,9 @@ class ServerProperties:
         """Create a backup of the current properties file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = self.backup_path / f"server.properties.{timestamp}"
-        
-        # Make sure backup directory exists
-        if not self.backup_path.exists():
-            self.backup_path.mkdir(parents=True, exist_ok=True)
-            
+
+        # backup_path is created in __init__
         if self.path.exists():
-            import shutil
             shutil.copy2(self.path, backup_file)
             return backup_file
         return None
@@ -206,8 +231,7 @@ class ServerProperties:
             # Ensure target directory exists
             if not self.path.parent.exists():
                 self.path.parent.mkdir(parents=True, exist_ok=True)
-                
-            import shutil
+
             shutil.copy2(backup_path, self.path)
             self.load()
             return True
@@ -219,20 +243,19 @@ class ServerProperties:
             return
 
         try:
-            with open(self.path, "r", encoding='utf-8') as file:
-                for line in file:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        try:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            try:
-                                setattr(self.properties, key, value)
-                            except PropertyValidationError as e:
-                                print(f"Warning: {str(e)}")
-                        except ValueError:
-                            print(f"Warning: Skipping malformed line: {line}")
+            text = self.path.read_text(encoding='utf-8')
+            for line in text.splitlines():
+                line = line.strip()
+                if not line or line[0] == '#':
+                    continue
+                key, sep, value = line.partition('=')
+                if not sep:
+                    print(f"Warning: Skipping malformed line: {line}")
+                    continue
+                try:
+                    setattr(self.properties, key.strip(), value.strip())
+                except PropertyValidationError as e:
+                    print(f"Warning: {str(e)}")
         except Exception as e:
             print(f"Error loading properties: {str(e)}")
             self.create_backup()
@@ -241,17 +264,24 @@ class ServerProperties:
         """Save properties with backup creation"""
         self.create_backup()
         try:
+            values = self.properties._values
+            definitions = self.properties._definitions
+            lines = [
+                f"# Generated by Voxely on {datetime.now().isoformat()}",
+                f"# Server Type: {self.properties._server_type}",
+                f"# Minecraft Version: {self.properties._version}",
+                "",
+            ]
+            # Sort properties by name for consistency
+            for key in sorted(values):
+                definition = definitions.get(key)
+                if definition:
+                    lines.append(f"# {definition.description}")
+                lines.append(f"{key}={values[key]}")
+
+            # Build the whole file first so it goes out in a single write
             with open(self.path, "w", encoding='utf-8') as file:
-                file.write(f"# Generated by Voxely on {datetime.now().isoformat()}\n")
-                file.write(f"# Server Type: {self.properties._server_type}\n")
-                file.write(f"# Minecraft Version: {self.properties._version}\n\n")
-                
-                # Sort properties by name for consistency
-                for key in sorted(self.properties._values.keys()):
-                    value = self.properties._values[key]
-                    if key in self.properties._definitions:
-                        file.write(f"# {self.properties._definitions[key].description}\n")
-                    file.write(f"{key}={value}\n")
+                file.write("\n".join(lines) + "\n")
         except Exception as e:
             print(f"Error saving properties: {str(e)}")
             return False
@@ -260,14 +290,14 @@ class ServerProperties:
     def get(self, key: str, default: Any = None) -> Any:
         """Get a property value with default fallback"""
         try:
-            return getattr(self.properties, key.replace("-", "_"))
+            return getattr(self.properties, key)
         except AttributeError:
             return default
 
     def set(self, key: str, value: Any):
         """Set a property value with validation"""
         try:
-            setattr(self.properties, key.replace("-", "_"), value)
+            setattr(self.properties, key, value)
             return True
         except PropertyValidationError as e:
             print(f"Error setting property: {str(e)}")
@@ -1,5 +1,6 @@
 import asyncio
 from asyncio.subprocess import Process
+from collections import deque
 from datetime import datetime
 from enum import StrEnum
 import os
@@ -19,6 +20,7 @@ from .serverProperties import ServerProperties
 from pathlib import Path
 import logging
 import glob
+from itertools import islice
 from dataclasses import dataclass
 from contextlib import contextmanager
 from .jar import ServerType
@@ -36,6 +38,9 @@ os.makedirs("logs", exist_ok=True)
 
 loop = asyncio.get_event_loop()
 
+# Console lines kept in memory per server; older lines are dropped
+MAX_LOG_LINES = 1000
+
 # Cache for server list to improve performance
 _server_cache = {
     "servers": [],
@@ -464,7 +469,7 @@ class Server:
             self.type = ServerType.PAPER
             self.version = "1.20.4"
             self.players_limit = 20
-            self.logs = []
+            self.logs = deque(maxlen=MAX_LOG_LINES)
             self.min_ram = 1024
             self.max_ram = 2048
             self.port = 25565
@@ -509,7 +514,7 @@ class Server:
                 self.type = ServerType.PAPER
                 self.version = "1.20.4"
                 self.players_limit = 20
-                self.logs = []
+                self.logs = deque(maxlen=MAX_LOG_LINES)
                 self.min_ram = 1024
                 self.max_ram = 2048
                 self.port = 25565
@@ -542,9 +547,10 @@ class Server:
             self.data = json_data
 
             for key, value in self.data.items():
-                if key in ["players"]:
+                if key in ["players", "logs"]:
                     continue
                 setattr(self, key, value)
+            self.logs = deque(self.data.get("logs") or [], maxlen=MAX_LOG_LINES)
 
             self.logger.debug(
                 f"Loaded data for {self.name}: type={self.type}, version={self.version}"
@@ -577,7 +583,7 @@ class Server:
             if await self.is_server_online == False:
                 self.logger.debug("Server is not running, updating status to OFFLINE")
                 self.data["status"] = ServerStatus.OFFLINE
-                self.logs = []
+                self.logs = deque(maxlen=MAX_LOG_LINES)
                 self.started_at = None
                 await self._save_state()
             self.status = ServerStatus.OFFLINE
@@ -589,7 +595,7 @@ class Server:
             # Fallback to default configuration
             self.status = ServerStatus.OFFLINE
             self.started_at = None
-            self.logs = []
+            self.logs = deque(maxlen=MAX_LOG_LINES)
 
             # Mark as invalid if we couldn't load the data
             if not (has_jar or has_eula):
@@ -781,7 +787,7 @@ class Server:
         self.type = type
         self.version = version
         self.players_limit = players_limit
-        self.logs = []
+        self.logs = deque(maxlen=MAX_LOG_LINES)
         self.min_ram = min_ram
         self.max_ram = max_ram
         self.port = port
@@ -822,7 +828,7 @@ class Server:
             "jar_full_path": self.jar_full_path,
             "port": self.port,
             "players": await self.players,
-            "logs": self.logs,
+            "logs": list(self.logs),
         }
 
         self._save_server_data()
@@ -1009,7 +1015,7 @@ rcon.password=sdu923rf873bdf4iu53aw2
     async def _save_state(self):
         self.data["status"] = self.status
         self.data["players"] = await self.players
-        self.data["logs"] = self.logs
+        self.data["logs"] = list(self.logs)
         self.data["started_at"] = (
             self.started_at.isoformat() if self.started_at != None else None
         )
@@ -1163,7 +1169,7 @@ rcon.password=sdu923rf873bdf4iu53aw2
             return
 
         self.logger.debug("Started output capture task")
-        self.logs = []
+        self.logs = deque(maxlen=MAX_LOG_LINES)
 
         while True:
             line_bytes = await self.process.stdout.readline()
@@ -1228,7 +1234,8 @@ rcon.password=sdu923rf873bdf4iu53aw2
             self.logger.debug(
                 f"Sending last {min(50, len(self.logs))} log lines to new client"
             )
-            for line in self.logs[-50:]:  # Send the last 50 lines to the new connection
+            # Send the last 50 lines to the new connection
+            for line in islice(self.logs, max(0, len(self.logs) - 50), None):
                 if asyncio.iscoroutinefunction(callback):
                     asyncio.run_coroutine_threadsafe(callback(line), loop)
                 else:
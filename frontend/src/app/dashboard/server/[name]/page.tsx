@@ -80,47 +80,54 @@ export default function ServerDetail() {
 
     ws.onmessage = (event) => {
       try {
-        const data: SocketMessage = JSON.parse(event.data);
-        switch (data.type) {
-          case "console":
-            // Handle nested console data structure
-            setConsoleOutput((prev) => [...prev, data.data]);
-            break;
-          case "info":
-            setServerDetails(data.data);
-            setLoading(false);
-            break;
-          case "ping":
-            ws.send(JSON.stringify({ action: "pong" }));
-            break;
-          case "need_eula":
-            setShowEulaModal(true);
-            break;
-          case "error":
-            console.error("Server error:", data.data);
-            setError(data.data || "An error occurred");
-            break;
-          case "status":
-            // Update server status
-            setServerDetails((prev) =>
-              prev ? { ...prev, status: data.data } : null
-            );
-            if (data.data === "online" || data.data === "offline") {
-              setActionInProgress("");
-            }
-            break;
-          case "player_update":
-            setServerDetails((prev) =>
-              prev ? { ...prev, players: data.data } : null
-            );
-            break;
-          case "file_init":
-            setFiles(data.data);
-            break;
-          case "file_update":
-            setFiles(data.data);
-            // Optionally handle file changes if needed
-            break;
+        // The backend coalesces bursts of messages into a single array frame
+        const parsed: SocketMessage | SocketMessage[] = JSON.parse(event.data);
+        const messages = Array.isArray(parsed) ? parsed : [parsed];
+        for (const data of messages) {
+          switch (data.type) {
+            case "console":
+              // Handle nested console data structure
+              setConsoleOutput((prev) => [...prev, data.data]);
+              break;
+            case "console_batch":
+              setConsoleOutput((prev) => [...prev, ...data.data]);
+              break;
+            case "info":
+              setServerDetails(data.data);
+              setLoading(false);
+              break;
+            case "ping":
+              ws.send(JSON.stringify({ action: "pong" }));
+              break;
+            case "need_eula":
+              setShowEulaModal(true);
+              break;
+            case "error":
+              console.error("Server error:", data.data);
+              setError(data.data || "An error occurred");
+              break;
+            case "status":
+              // Update server status
+              setServerDetails((prev) =>
+                prev ? { ...prev, status: data.data } : null
+              );
+              if (data.data === "online" || data.data === "offline") {
+                setActionInProgress("");
+              }
+              break;
+            case "player_update":
+              setServerDetails((prev) =>
+                prev ? { ...prev, players: data.data } : null
+              );
+              break;
+            case "file_init":
+              setFiles(data.data);
+              break;
+            case "file_update":
+              setFiles(data.data);
+              // Optionally handle file changes if needed
+              break;
+          }
         }
       } catch (err) {
         console.error("Error parsing WebSocket message:", err);
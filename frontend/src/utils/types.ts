@@ -69,6 +69,10 @@ export type SocketMessage =
       type: "console";
       data: ConsoleMessage;
     }
+  | {
+      type: "console_batch";
+      data: ConsoleMessage[];
+    }
   | {
       type: "status";
       data: string;